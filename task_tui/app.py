@@ -1,7 +1,22 @@
+"""A modern, interactive TUI for Taskwarrior built with Textual."""
+
+import argparse
+import asyncio
+import calendar
+import csv
 import json
+import sqlite3
 import subprocess
 import re
 import os
+import threading
+import tracemalloc
+import uuid as uuid_lib
+from bisect import bisect_left, insort
+from contextlib import closing, contextmanager
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from textual import work
 from textual.app import App, ComposeResult
 from textual.widgets import (
     Header,
@@ -14,10 +29,1709 @@ from textual.widgets import (
     TextArea,
     ListItem,
     ListView,
+    Tab,
+    Tabs,
 )
 from textual.containers import Horizontal, Vertical
 from textual.binding import Binding
+from textual import screen as textual_screen
 from textual.screen import ModalScreen
+from textual.suggester import Suggester
+
+
+# --- BACKEND ---
+class DirectBackend:
+    """Runs every command as its own `task` process."""
+
+    def run(self, cmd, input=None):
+        return subprocess.run(cmd, capture_output=True, text=True, input=input)
+
+
+# Swapped for a daemon client at startup when `task-tui --daemon` is running
+backend = DirectBackend()
+
+
+def set_backend(new_backend):
+    global backend
+    backend = new_backend
+
+
+def task_run(cmd, input=None):
+    """Run a `task` command line through the active backend."""
+    return backend.run(cmd, input)
+
+
+def task_export(*filters):
+    """Run `task export` for the given filter words and return the parsed list."""
+    res = task_run(["task", *filters, "export", "rc.json.array=on"])
+    try:
+        return json.loads(res.stdout)
+    except:
+        return []
+
+
+EXPORT_CHUNK = 500  # uuids per `task export`, far below the argument size limit
+
+
+def export_uuids(uuids):
+    """task_export of the given tasks, a chunk of uuids per command."""
+    uuids = list(uuids)
+    tasks = []
+    for start in range(0, len(uuids), EXPORT_CHUNK):
+        tasks.extend(task_export(*uuids[start : start + EXPORT_CHUNK]))
+    return tasks
+
+
+def tw_date(dt):
+    """Format a datetime the way Taskwarrior exports it (UTC, ISO basic)."""
+    return dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def parse_tw_date(value):
+    """Parse an exported Taskwarrior date (20240131T120000Z) as an aware datetime."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def load_task_config():
+    """Taskwarrior settings as a dict, read once per session from `task _show`."""
+    res = task_run(["task", "_show"])
+    config = {}
+    for line in res.stdout.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            config[key.strip()] = value.strip()
+    return config
+
+
+def parse_depends(value):
+    """Normalise the `depends` field (list or comma string) to a list of uuids."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [d.strip() for d in value.split(",") if d.strip()]
+    return [str(d) for d in value]
+
+
+# --- DATES ---
+WEEKDAYS = [
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+]
+MONTHS = [
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+]
+# Duration units: seconds for fixed lengths, ("months", n) for calendar ones
+DURATION_UNITS = {
+    **dict.fromkeys(["s", "sec", "secs", "second", "seconds"], 1),
+    **dict.fromkeys(["min", "mins", "minute", "minutes"], 60),
+    **dict.fromkeys(["h", "hr", "hrs", "hour", "hours"], 3600),
+    **dict.fromkeys(["d", "day", "days"], 86400),
+    **dict.fromkeys(["w", "wk", "wks", "week", "weeks"], 7 * 86400),
+    **dict.fromkeys(["mo", "mth", "mths", "month", "months"], ("months", 1)),
+    **dict.fromkeys(["q", "qtr", "qtrs", "quarter", "quarters"], ("months", 3)),
+    **dict.fromkeys(["y", "yr", "yrs", "year", "years"], ("months", 12)),
+}
+DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y%m%d",
+    "%Y%m%dT%H%M%S",
+]
+PERIOD_RE = re.compile(r"(so|eo)([cnp]?)(d|ww|w|m|q|y)")
+DURATION_RE = re.compile(r"(\d+)\s*([a-z]+)")
+ARITHMETIC_RE = re.compile(r"(.+?)([+-])(\d+\s*[a-z]+)")
+
+
+def add_months(dt, months):
+    year, month = divmod(dt.year * 12 + dt.month - 1 + months, 12)
+    # Clamp the day (Jan 31 + 1 month is the end of February)
+    last_day = calendar.monthrange(year, month + 1)[1]
+    return dt.replace(year=year, month=month + 1, day=min(dt.day, last_day))
+
+
+def apply_duration(dt, text, sign=1):
+    """dt shifted by a duration like `3d` or `2wks` (None if text is not one)."""
+    match = DURATION_RE.fullmatch(text.strip())
+    if not match or match.group(2) not in DURATION_UNITS:
+        return None
+    count = int(match.group(1)) * sign
+    unit = DURATION_UNITS[match.group(2)]
+    if isinstance(unit, tuple):
+        return add_months(dt, unit[1] * count)
+    return dt + timedelta(seconds=unit * count)
+
+
+def period_start(day, unit, offset, weekstart):
+    """Start of the day/week/month/quarter/year containing day, shifted by offset periods."""
+    if unit == "d":
+        return day + timedelta(days=offset)
+    if unit in ("w", "ww"):
+        first = 0 if unit == "ww" else WEEKDAYS.index(weekstart)
+        start = day - timedelta(days=(day.weekday() - first) % 7)
+        return start + timedelta(weeks=offset)
+    if unit == "m":
+        return add_months(day.replace(day=1), offset)
+    if unit == "q":
+        return add_months(
+            day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1), 3 * offset
+        )
+    return day.replace(month=1, day=1, year=day.year + offset)
+
+
+def named_date(word, now, weekstart):
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if word == "now":
+        return now
+    if word in ("today", "sod"):
+        return today
+    if word == "yesterday":
+        return today - timedelta(days=1)
+    if word == "tomorrow":
+        return today + timedelta(days=1)
+    if word in ("later", "someday"):
+        return today.replace(year=9999, month=12, day=30)
+    match = PERIOD_RE.fullmatch(word)
+    if match:
+        edge, which, unit = match.groups()
+        # Like Taskwarrior, a bare som/sow/soy is the start of the *next* period
+        # (socm is the current one) while a bare eom ends the current one
+        offset = {"n": 1, "p": -1, "c": 0}.get(which, 1 if edge == "so" else 0)
+        start = period_start(today, unit, offset, weekstart)
+        if edge == "so":
+            return start
+        if unit == "ww":
+            # The work week ends on Friday night
+            return start + timedelta(days=5) - timedelta(seconds=1)
+        return period_start(start, unit, 1, weekstart) - timedelta(seconds=1)
+    for idx, name in enumerate(WEEKDAYS):
+        if word in (name, name[:3]):
+            days = (idx - today.weekday()) % 7 or 7
+            return today + timedelta(days=days)
+    for idx, name in enumerate(MONTHS):
+        if word in (name, name[:3]):
+            first = today.replace(month=idx + 1, day=1)
+            return first if first > today else first.replace(year=today.year + 1)
+    match = re.fullmatch(r"(\d{1,2})(st|nd|rd|th)", word)
+    if match and 1 <= int(match.group(1)) <= 31:
+        day = int(match.group(1))
+        month_start = today.replace(day=1)
+        for months in range(0, 3):
+            candidate = add_months(month_start, months)
+            try:
+                candidate = candidate.replace(day=day)
+            except ValueError:
+                continue
+            if candidate > today:
+                return candidate
+    return None
+
+
+def local_naive(dt):
+    """dt as a naive local wall-clock time (a naive dt is taken as local already)."""
+    return dt.astimezone().replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def eval_date(expr, now=None, base=None, weekstart="sunday"):
+    """Evaluate a Taskwarrior date expression locally (raises ValueError).
+
+    Understands absolute dates (20241231, 2024-12-31T10:00, exported UTC
+    stamps), named dates (today, eow, som, sonw, eopm, friday, jan, 15th...),
+    bare durations from now (2wks) and `<date>+/-<duration>` where the date
+    may be `due` for the task's current due date (base).
+
+    The arithmetic runs on naive local times and the result only gets its
+    UTC offset at the end, so a date past a DST change keeps its local time.
+    """
+    now = local_naive(now or datetime.now())
+    base = local_naive(base) if base else None
+    return eval_local_date(expr, now, base, weekstart.lower()).astimezone()
+
+
+def eval_local_date(expr, now, base, weekstart):
+    text = expr.strip().lower()
+    if not text:
+        raise ValueError("empty date")
+    if text == "due":
+        if base is None:
+            raise ValueError("no current due date")
+        return base
+    if text.endswith("z"):
+        # UTC stamps, compact (20261019T100000Z) or ISO (2026-10-19T10:00:00Z)
+        stamp = parse_tw_date(text.upper().replace("-", "").replace(":", ""))
+        if stamp:
+            return local_naive(stamp)
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text.upper(), fmt)
+        except ValueError:
+            pass
+    named = named_date(text, now, weekstart)
+    if named:
+        return named
+    shifted = apply_duration(now, text)
+    if shifted:
+        return shifted
+    match = ARITHMETIC_RE.fullmatch(text)
+    if match:
+        start = eval_local_date(match.group(1), now, base, weekstart)
+        shifted = apply_duration(
+            start, match.group(3), -1 if match.group(2) == "-" else 1
+        )
+        if shifted:
+            return shifted
+    raise ValueError(f"unknown date '{expr.strip()}'")
+
+
+def format_due_input(value):
+    """An exported due stamp as local YYYYMMDD (with THHMMSS unless midnight)."""
+    due = parse_tw_date(value)
+    if not due:
+        return ""
+    due = due.astimezone()
+    if (due.hour, due.minute, due.second) == (0, 0, 0):
+        return due.strftime("%Y%m%d")
+    return due.strftime("%Y%m%dT%H%M%S")
+
+
+# --- DEPENDENCY GRAPH ---
+class DependencyGraph:
+    """Forward/reverse dependency adjacency for the loaded (pending) tasks.
+
+    Only tasks present in `nodes` count as unfinished, so an edge to a
+    completed task neither blocks nor shows up in the views.
+    """
+
+    def __init__(self):
+        self.nodes = set()
+        self.forward = {}  # uuid -> uuids it depends on
+        self.reverse = {}  # uuid -> uuids depending on it
+        self.blocked = set()  # unfinished tasks with an unfinished dependency
+
+    def set_task(self, uuid, depends):
+        self.nodes.add(uuid)
+        new_deps = set(depends)
+        old_deps = self.forward.get(uuid, set())
+        for dep in old_deps - new_deps:
+            users = self.reverse.get(dep)
+            if users:
+                users.discard(uuid)
+                if not users:
+                    del self.reverse[dep]
+        for dep in new_deps - old_deps:
+            self.reverse.setdefault(dep, set()).add(uuid)
+        if new_deps:
+            self.forward[uuid] = new_deps
+        else:
+            self.forward.pop(uuid, None)
+        self.update_blocked(uuid)
+
+    def remove_task(self, uuid):
+        self.set_task(uuid, [])
+        self.nodes.discard(uuid)
+        self.update_blocked(uuid)
+
+    def update_blocked(self, uuid):
+        """Re-check uuid and the tasks depending on it after it changed."""
+        for node in (uuid, *self.reverse.get(uuid, ())):
+            if node in self.nodes and self.is_blocked(node):
+                self.blocked.add(node)
+            else:
+                self.blocked.discard(node)
+
+    def apply(self, changes):
+        """Update the adjacency for the (old, new) task pairs of a store diff."""
+        for old, new in changes:
+            if new is None:
+                self.remove_task(old["uuid"])
+            else:
+                self.set_task(new["uuid"], parse_depends(new.get("depends")))
+
+    def depends_on(self, uuid):
+        return [d for d in self.forward.get(uuid, ()) if d in self.nodes]
+
+    def blocking(self, uuid):
+        return [u for u in self.reverse.get(uuid, ()) if u in self.nodes]
+
+    def is_blocked(self, uuid):
+        return any(d in self.nodes for d in self.forward.get(uuid, ()))
+
+    def is_blocking(self, uuid):
+        return any(u in self.nodes for u in self.reverse.get(uuid, ()))
+
+    def blocked_count(self):
+        return len(self.blocked)
+
+    def transitive(self, uuid, reverse=False):
+        """All unfinished tasks reachable from uuid, nearest first."""
+        edges = self.reverse if reverse else self.forward
+        seen = {uuid}
+        order = []
+        queue = [uuid]
+        while queue:
+            nxt = []
+            for node in queue:
+                for other in edges.get(node, ()):
+                    if other not in seen and other in self.nodes:
+                        seen.add(other)
+                        order.append(other)
+                        nxt.append(other)
+            queue = nxt
+        return order
+
+    def find_cycle(self, uuid, new_deps):
+        """Return the cycle path if uuid were to depend on new_deps, else None."""
+        for dep in new_deps:
+            if dep == uuid:
+                return [uuid, uuid]
+            parents = {dep: None}
+            queue = [dep]
+            while queue:
+                node = queue.pop()
+                if node == uuid:
+                    path = []
+                    while node is not None:
+                        path.append(node)
+                        node = parents[node]
+                    return [uuid] + path[::-1]
+                for other in self.forward.get(node, ()):
+                    if other not in parents:
+                        parents[other] = node
+                        queue.append(other)
+        return None
+
+    def critical_path(self, uuid=None):
+        """Longest chain of unfinished prerequisites, from uuid down to the first task to do.
+
+        Without a uuid, the longest chain in the whole graph is returned.
+        """
+        depth = {}
+        best_next = {}
+        roots = [uuid] if uuid else list(self.forward)
+        for root in roots:
+            if root in depth:
+                continue
+            visiting = set()
+            stack = [(root, False)]
+            while stack:
+                node, expanded = stack.pop()
+                if expanded:
+                    best, pick = 0, None
+                    for dep in self.depends_on(node):
+                        if dep in depth and depth[dep] + 1 > best:
+                            best, pick = depth[dep] + 1, dep
+                    depth[node] = best
+                    best_next[node] = pick
+                    continue
+                if node in depth or node in visiting:
+                    continue
+                visiting.add(node)
+                stack.append((node, True))
+                for dep in self.depends_on(node):
+                    if dep not in depth and dep not in visiting:
+                        stack.append((dep, False))
+        if not depth:
+            return []
+        start = uuid if uuid else max(depth, key=depth.get)
+        path = []
+        while start is not None and start not in path:
+            path.append(start)
+            start = best_next.get(start)
+        return path
+
+
+# --- URGENCY ---
+class UrgencyModel:
+    """Taskwarrior's urgency polynomial, evaluated locally.
+
+    Coefficients come from the `urgency.*` settings (Taskwarrior's defaults
+    when unset) so the result matches what the next export will report.
+    """
+
+    DEFAULTS = {
+        "urgency.user.tag.next.coefficient": 15.0,
+        "urgency.due.coefficient": 12.0,
+        "urgency.blocking.coefficient": 8.0,
+        "urgency.uda.priority.H.coefficient": 6.0,
+        "urgency.uda.priority.M.coefficient": 3.9,
+        "urgency.uda.priority.L.coefficient": 1.8,
+        "urgency.scheduled.coefficient": 5.0,
+        "urgency.active.coefficient": 4.0,
+        "urgency.age.coefficient": 2.0,
+        "urgency.annotations.coefficient": 1.0,
+        "urgency.tags.coefficient": 1.0,
+        "urgency.project.coefficient": 1.0,
+        "urgency.waiting.coefficient": -3.0,
+        "urgency.blocked.coefficient": -5.0,
+        "urgency.age.max": 365.0,
+    }
+
+    def __init__(self, config=None):
+        self.config = config
+        self._coefficients = None
+
+    @property
+    def coefficients(self):
+        if self._coefficients is None:
+            config = load_task_config() if self.config is None else self.config
+            coefficients = dict(self.DEFAULTS)
+            for key, value in config.items():
+                if key.startswith("urgency."):
+                    try:
+                        coefficients[key] = float(value)
+                    except ValueError:
+                        pass
+            self._coefficients = coefficients
+        return self._coefficients
+
+    @staticmethod
+    def count_factor(count):
+        # Same step function Taskwarrior uses for tags and annotations
+        if count == 0:
+            return 0.0
+        return {1: 0.8, 2: 0.9}.get(count, 1.0)
+
+    @staticmethod
+    def due_factor(due, now):
+        days_overdue = (now - due).total_seconds() / 86400
+        if days_overdue >= 7.0:
+            return 1.0
+        if days_overdue >= -14.0:
+            return ((days_overdue + 14.0) * 0.8 / 21.0) + 0.2
+        return 0.2
+
+    def compute(self, t, graph=None, now=None):
+        c = self.coefficients
+        now = now or datetime.now(timezone.utc)
+        tags = t.get("tags", [])
+        project = t.get("project", "")
+        uuid = t.get("uuid")
+
+        urgency = 0.0
+        if project:
+            urgency += c["urgency.project.coefficient"]
+        if t.get("start"):
+            urgency += c["urgency.active.coefficient"]
+        scheduled = parse_tw_date(t.get("scheduled"))
+        if scheduled and scheduled < now:
+            urgency += c["urgency.scheduled.coefficient"]
+        if t.get("status") == "waiting":
+            urgency += c["urgency.waiting.coefficient"]
+        if graph is not None and uuid:
+            if graph.is_blocked(uuid):
+                urgency += c["urgency.blocked.coefficient"]
+            if graph.is_blocking(uuid):
+                urgency += c["urgency.blocking.coefficient"]
+        urgency += (
+            self.count_factor(len(t.get("annotations", [])))
+            * c["urgency.annotations.coefficient"]
+        )
+        urgency += self.count_factor(len(tags)) * c["urgency.tags.coefficient"]
+
+        due = parse_tw_date(t.get("due"))
+        if due:
+            urgency += self.due_factor(due, now) * c["urgency.due.coefficient"]
+
+        entry = parse_tw_date(t.get("entry"))
+        if entry:
+            age = (now - entry).total_seconds() / 86400
+            age_max = c["urgency.age.max"]
+            factor = 1.0 if age_max == 0 or age > age_max else age / age_max
+            urgency += factor * c["urgency.age.coefficient"]
+
+        # Per tag / project / UDA value coefficients
+        for key, coefficient in c.items():
+            if not key.endswith(".coefficient"):
+                continue
+            if key.startswith("urgency.user.tag."):
+                if key[17:-12] in tags:
+                    urgency += coefficient
+            elif key.startswith("urgency.user.project."):
+                if project and project.startswith(key[21:-12]):
+                    urgency += coefficient
+            elif key.startswith("urgency.uda."):
+                name, _, value = key[12:-12].partition(".")
+                if value and str(t.get(name, "")) == value:
+                    urgency += coefficient
+        return round(urgency, 4)
+
+
+# --- COMPLETION ---
+class PrefixTrie:
+    """Case-insensitive prefix tree mapping words to reference-counted values."""
+
+    END = ""  # child key marking the end of a word
+
+    def __init__(self):
+        self.root = {}
+        self.refs = {}  # casefolded word -> {value: count}
+
+    def add(self, word, value=None):
+        key = word.casefold()
+        if not key:
+            return
+        refs = self.refs.get(key)
+        if refs is None:
+            node = self.root
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[self.END] = key
+            refs = self.refs[key] = {}
+        value = word if value is None else value
+        refs[value] = refs.get(value, 0) + 1
+
+    def discard(self, word, value=None):
+        key = word.casefold()
+        value = word if value is None else value
+        refs = self.refs.get(key)
+        if not refs or value not in refs:
+            return
+        refs[value] -= 1
+        if refs[value] <= 0:
+            del refs[value]
+        if refs:
+            return
+        del self.refs[key]
+        # Prune the branch that no longer leads to any word
+        path = [self.root]
+        for ch in key:
+            path.append(path[-1][ch])
+        del path[-1][self.END]
+        for i in range(len(key) - 1, -1, -1):
+            if path[i + 1]:
+                break
+            del path[i][key[i]]
+
+    def complete(self, prefix, limit=5):
+        """Values of the words starting with prefix, most referenced first."""
+        node = self.root
+        for ch in prefix.casefold():
+            node = node.get(ch)
+            if node is None:
+                return []
+        scores = {}
+        shortest = {}  # prefer the closest match when counts tie
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for ch, child in node.items():
+                if ch == self.END:
+                    for value, count in self.refs[child].items():
+                        scores[value] = scores.get(value, 0) + count
+                        shortest[value] = min(
+                            shortest.get(value, len(child)), len(child)
+                        )
+                else:
+                    stack.append(child)
+        ranked = sorted(scores, key=lambda v: (-scores[v], shortest[v], str(v)))
+        return ranked[:limit]
+
+
+class SortedPrefixIndex:
+    """PrefixTrie's interface over a sorted list, for long words like descriptions.
+
+    A trie spends a dict per character, which adds up to megabytes once every
+    task description is in it. Here each word is one (casefolded word, value)
+    entry and the words with a prefix are a contiguous run found by bisect.
+    """
+
+    def __init__(self):
+        self.entries = []  # sorted (casefolded word, value), one per add
+
+    def add(self, word, value=None):
+        key = word.casefold()
+        if key:
+            insort(self.entries, (key, word if value is None else value))
+
+    def discard(self, word, value=None):
+        entry = (word.casefold(), word if value is None else value)
+        i = bisect_left(self.entries, entry)
+        if i < len(self.entries) and self.entries[i] == entry:
+            del self.entries[i]
+
+    def complete(self, prefix, limit=5):
+        """Values of the words starting with prefix, most referenced first."""
+        prefix = prefix.casefold()
+        scores = {}
+        shortest = {}  # prefer the closest match when counts tie
+        for i in range(bisect_left(self.entries, (prefix,)), len(self.entries)):
+            key, value = self.entries[i]
+            if not key.startswith(prefix):
+                break
+            scores[value] = scores.get(value, 0) + 1
+            shortest[value] = min(shortest.get(value, len(key)), len(key))
+        ranked = sorted(scores, key=lambda v: (-scores[v], shortest[v], str(v)))
+        return ranked[:limit]
+
+
+class CompletionIndex:
+    """Project, tag and task completion kept in step with the store diffs."""
+
+    def __init__(self):
+        self.projects = PrefixTrie()
+        self.tags = PrefixTrie()
+        self.tasks = SortedPrefixIndex()  # id and description -> uuid
+
+    def entries(self, t):
+        project = t.get("project", "")
+        if project:
+            # Index every level so "work" and "work.infra" complete on their own
+            parts = project.split(".")
+            for i in range(1, len(parts) + 1):
+                yield self.projects, ".".join(parts[:i]), None
+        for tag in t.get("tags", []):
+            yield self.tags, tag, None
+        if t.get("id"):
+            yield self.tasks, str(t["id"]), t["uuid"]
+        if t.get("description"):
+            yield self.tasks, t["description"], t["uuid"]
+
+    def apply(self, changes):
+        for old, new in changes:
+            if old is not None:
+                for trie, word, value in self.entries(old):
+                    trie.discard(word, value)
+            if new is not None:
+                for trie, word, value in self.entries(new):
+                    trie.add(word, value)
+
+
+class TrieSuggester(Suggester):
+    """Inline Input completion of the last (comma-separated) word from a trie."""
+
+    def __init__(self, trie, multi=False):
+        super().__init__(use_cache=False, case_sensitive=True)
+        self.trie = trie
+        self.multi = multi
+
+    async def get_suggestion(self, value):
+        word = value.rpartition(",")[2] if self.multi else value
+        word = word.lstrip()
+        if not word:
+            return None
+        for match in self.trie.complete(word, 1):
+            if len(match) > len(word):
+                return value + match[len(word) :]
+        return None
+
+
+# --- UNDO LOG ---
+TASK_BULK = ["task", "rc.confirmation=off", "rc.bulk=0"]
+
+
+def field_args(fields):
+    """Turn {field: value} into Taskwarrior `field:value` modification words."""
+    args = []
+    for key, value in sorted(fields.items()):
+        if isinstance(value, list):
+            value = ",".join(map(str, value))
+        args.append(f"{key}:{'' if value is None else value}")
+    return args
+
+
+def batch_modify(fields_by_uuid):
+    """One `task modify` per distinct set of modifications instead of one per task."""
+    groups = {}
+    for uuid, fields in fields_by_uuid.items():
+        groups.setdefault(tuple(field_args(fields)), []).append(uuid)
+    return [[*TASK_BULK, *uuids, "modify", *args] for args, uuids in groups.items()]
+
+
+class Operation:
+    """One user action with the field values needed to revert and replay it."""
+
+    def __init__(self, label, kind, before, after=None):
+        self.label = label
+        self.kind = kind  # "modify", "done" or "add"
+        self.before = before  # uuid -> field values before the action
+        self.after = after or {}  # uuid -> field values it set
+
+    @property
+    def uuids(self):
+        return list(self.before)
+
+    def undo_commands(self):
+        if self.kind == "done":
+            return [[*TASK_BULK, *self.uuids, "modify", "status:pending"]]
+        if self.kind == "add":
+            return [[*TASK_BULK, *self.uuids, "delete"]]
+        return batch_modify(self.before)
+
+    def redo_commands(self):
+        if self.kind == "done":
+            return [[*TASK_BULK, *self.uuids, "done"]]
+        if self.kind == "add":
+            return [[*TASK_BULK, *self.uuids, "modify", "status:pending"]]
+        return batch_modify(self.after)
+
+
+class OperationLog:
+    """Undo/redo stacks of the operations made in this session."""
+
+    def __init__(self, limit=200):
+        self.limit = limit
+        self.done = []
+        self.undone = []
+
+    def record(self, op):
+        self.done.append(op)
+        del self.done[: -self.limit]
+        self.undone.clear()
+
+    def undo(self):
+        if not self.done:
+            return None
+        op = self.done.pop()
+        self.undone.append(op)
+        return op
+
+    def redo(self):
+        if not self.undone:
+            return None
+        op = self.undone.pop()
+        self.done.append(op)
+        return op
+
+
+# --- WORKSPACES ---
+def parse_filter(text):
+    """Split a filter like `project:work +next -someday fix` into match terms."""
+    terms = []
+    for word in text.split():
+        key, sep, value = word.partition(":")
+        if word.startswith("+") and len(word) > 1:
+            terms.append(("tag", word[1:]))
+        elif word.startswith("-") and len(word) > 1:
+            terms.append(("notag", word[1:]))
+        elif sep and key in ("project", "proj", "pro"):
+            terms.append(("project", value))
+        elif sep and key in ("priority", "prio", "pri"):
+            terms.append(("priority", value.upper()))
+        else:
+            terms.append(("text", word.casefold()))
+    return terms
+
+
+def task_matches(t, terms):
+    """Evaluate parse_filter terms locally against an exported task."""
+    tags = t.get("tags", [])
+    for kind, value in terms:
+        if kind == "project":
+            project = t.get("project", "")
+            if value and project != value and not project.startswith(value + "."):
+                return False
+            if not value and project:
+                return False
+        elif kind == "tag":
+            if value == "ACTIVE":
+                if not t.get("start"):
+                    return False
+            elif value not in tags:
+                return False
+        elif kind == "notag":
+            if value in tags:
+                return False
+        elif kind == "priority":
+            if t.get("priority", "") != value:
+                return False
+        elif value not in t.get("description", "").casefold():
+            return False
+    return True
+
+
+class Workspace:
+    """A tab over the shared store with its own filter, sort, cursor and selection.
+
+    The matching uuids are kept in a sorted list updated from the store diffs,
+    so switching to a workspace never sorts or exports anything.
+    """
+
+    def __init__(self, name, filter_text="", sort_state=None):
+        self.name = name
+        self.filter_text = filter_text
+        self.terms = parse_filter(filter_text)
+        self.sort_state = sort_state or {"index": 5, "reverse": True}
+        self.cursor_uuid = None
+        self.selected_uuids = set()
+        self.tab_id = None
+        self.keys = {}  # uuid -> (sort value, uuid)
+        self.order = []  # sorted keys, ascending
+        self.grouped = False  # nest rows under their project hierarchy
+        self.expanded = set()  # project paths open in the grouped view
+
+    @property
+    def sort_key(self):
+        return TASK_COLUMNS[self.sort_state["index"]][1]
+
+    @property
+    def descending(self):
+        # Priority is always shown highest first, whatever the arrow says
+        return True if self.sort_key == "priority" else self.sort_state["reverse"]
+
+    def rebuild(self, tasks):
+        key = self.sort_key
+        self.keys = {
+            t["uuid"]: (sort_value(t, key), t["uuid"])
+            for t in tasks
+            if task_matches(t, self.terms)
+        }
+        self.order = sorted(self.keys.values())
+        self.selected_uuids &= self.keys.keys()
+
+    def apply(self, changes):
+        key = self.sort_key
+        for old, new in changes:
+            uuid = (new or old)["uuid"]
+            entry = self.keys.pop(uuid, None)
+            if entry is not None:
+                del self.order[bisect_left(self.order, entry)]
+            if new is not None and task_matches(new, self.terms):
+                entry = (sort_value(new, key), uuid)
+                self.keys[uuid] = entry
+                insort(self.order, entry)
+            else:
+                # Finished elsewhere or filtered out: no longer something to act on
+                self.selected_uuids.discard(uuid)
+
+    def uuids(self):
+        entries = reversed(self.order) if self.descending else self.order
+        return [uuid for _, uuid in entries]
+
+
+class PromptScreen(ModalScreen):
+    def __init__(self, title, placeholder=""):
+        super().__init__()
+        self.title_text = title
+        self.placeholder = placeholder
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="prompt_container"):
+            yield Label(self.title_text, id="fuzzy_header")
+            yield Input(placeholder=self.placeholder, id="prompt_input")
+
+    def on_mount(self) -> None:
+        self.query_one("#prompt_input").focus()
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        event.stop()
+        self.dismiss(event.value)
+
+    def on_key(self, event) -> None:
+        if event.key == "escape":
+            self.dismiss(None)
+
+
+# --- SUMMARY ---
+class SummaryCounters:
+    """Pending-task aggregates kept up to date from the store diffs.
+
+    Nothing here rescans the task list: every diff pair subtracts the old
+    task's contribution and adds the new one. Due dates are kept as a sorted
+    list so overdue/due-today are two bisects at read time.
+    """
+
+    URGENCY_BUCKETS = [
+        (20, "20+"),
+        (15, "15-20"),
+        (10, "10-15"),
+        (5, "5-10"),
+        (None, "<5"),
+    ]
+
+    def __init__(self):
+        self.pending = 0
+        self.active = 0
+        self.by_project = {}
+        self.urgency = {label: 0 for _, label in self.URGENCY_BUCKETS}
+        self.due = []  # sorted due timestamps (exported form sorts chronologically)
+
+    @classmethod
+    def urgency_bucket(cls, value):
+        for floor, label in cls.URGENCY_BUCKETS:
+            if floor is None or value >= floor:
+                return label
+
+    def count(self, t, step):
+        self.pending += step
+        if t.get("start"):
+            self.active += step
+        project = t.get("project", "")
+        self.by_project[project] = self.by_project.get(project, 0) + step
+        if not self.by_project[project]:
+            del self.by_project[project]
+        try:
+            urgency = float(t.get("urgency", 0))
+        except (TypeError, ValueError):
+            urgency = 0.0
+        self.urgency[self.urgency_bucket(urgency)] += step
+        due = t.get("due")
+        if due:
+            if step > 0:
+                insort(self.due, due)
+            else:
+                idx = bisect_left(self.due, due)
+                if idx < len(self.due) and self.due[idx] == due:
+                    del self.due[idx]
+
+    def apply(self, changes):
+        for old, new in changes:
+            if old is not None:
+                self.count(old, -1)
+            if new is not None:
+                self.count(new, 1)
+
+    def due_counts(self, now=None):
+        """(overdue, due later today) at the given moment."""
+        now = now or datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        overdue = bisect_left(self.due, tw_date(now))
+        today = bisect_left(self.due, tw_date(midnight + timedelta(days=1)))
+        return overdue, today - overdue
+
+    def snapshot(self):
+        overdue, due_today = self.due_counts()
+        return {
+            "pending": self.pending,
+            "active": self.active,
+            "overdue": overdue,
+            "due_today": due_today,
+            "by_project": dict(self.by_project),
+            "urgency": dict(self.urgency),
+        }
+
+
+# --- TASK STORE ---
+class TaskStore:
+    """Pending tasks indexed by uuid, diffed against each new export.
+
+    Every load produces (old, new) pairs for the tasks that changed (old is
+    None for new tasks, new is None for removed ones) and hands them to the
+    registered indexes so they are updated instead of rebuilt.
+    """
+
+    def __init__(self):
+        self.by_uuid = {}
+        self.by_id = {}
+        self.graph = DependencyGraph()
+        self.completion = CompletionIndex()
+        self.summary = SummaryCounters()
+        self.listeners = [self.graph, self.completion, self.summary]
+
+    def get(self, uuid):
+        return self.by_uuid.get(uuid)
+
+    def tasks(self):
+        return list(self.by_uuid.values())
+
+    def resolve(self, ref):
+        """Turn an id or uuid reference into a uuid (None if unknown)."""
+        ref = str(ref).strip()
+        if ref in self.by_uuid:
+            return ref
+        task = self.by_id.get(ref)
+        return task["uuid"] if task else None
+
+    def patch(self, uuid, fields):
+        """Apply a local edit to one task (empty values remove the attribute)."""
+        old = self.by_uuid.get(uuid)
+        if old is None:
+            return None
+        new = dict(old)
+        for key, value in fields.items():
+            if value is None or value == "" or value == []:
+                new.pop(key, None)
+            else:
+                new[key] = value
+        self.by_uuid[uuid] = new
+        if new.get("id"):
+            self.by_id[str(new["id"])] = new
+        for listener in self.listeners:
+            listener.apply([(old, new)])
+        return new
+
+    def update(self, uuids, tasks):
+        """Refresh only the given uuids; tasks maps those still pending to their export."""
+        changes = []
+        for uuid in uuids:
+            old = self.by_uuid.get(uuid)
+            new = tasks.get(uuid)
+            if old == new:
+                continue
+            if old is not None and self.by_id.get(str(old.get("id"))) is old:
+                del self.by_id[str(old.get("id"))]
+            if new is None:
+                del self.by_uuid[uuid]
+            else:
+                self.by_uuid[uuid] = new
+                if new.get("id"):
+                    self.by_id[str(new["id"])] = new
+            changes.append((old, new))
+        for listener in self.listeners:
+            listener.apply(changes)
+        return changes
+
+    def load(self, tasks):
+        """Replace the snapshot and return the (old, new) pairs that differ."""
+        changes = []
+        new = {}
+        for t in tasks:
+            uuid = t.get("uuid")
+            if not uuid:
+                continue
+            old = self.by_uuid.get(uuid)
+            if old != t:
+                changes.append((old, t))
+            new[uuid] = t
+        changes.extend((t, None) for uuid, t in self.by_uuid.items() if uuid not in new)
+        self.by_uuid = new
+        self.by_id = {str(t.get("id")): t for t in tasks if t.get("id")}
+        for listener in self.listeners:
+            listener.apply(changes)
+        return changes
+
+
+# --- TABLE RENDERING ---
+TASK_COLUMNS = [
+    ("ID", "id"),
+    ("Proj.", "project"),
+    ("P.", "priority"),
+    ("Due", "due"),
+    ("Tags", "tags"),
+    ("Urg.", "urgency"),
+    ("Desc.", "description"),
+]
+
+# Standard ANSI/Xterm colors (avoiding very dark ones)
+PROJECT_COLORS = [
+    "green",
+    "yellow",
+    "blue",
+    "magenta",
+    "cyan",
+    "white",
+    "bright_black",
+    "bright_red",
+    "bright_green",
+    "bright_yellow",
+    "bright_blue",
+    "bright_magenta",
+    "bright_cyan",
+    "bright_white",
+    "orange1",
+    "orange_red1",
+    "orchid",
+    "pale_green1",
+    "pale_turquoise1",
+    "hot_pink",
+    "indian_red",
+    "khaki1",
+    "light_coral",
+    "light_pink1",
+    "light_salmon1",
+    "light_sea_green",
+    "light_skyblue1",
+    "light_slate_blue",
+    "light_steel_blue1",
+    "medium_orchid1",
+    "medium_purple1",
+    "medium_spring_green",
+]
+
+
+def sort_value(t, sort_key):
+    val = t.get(sort_key, "")
+    if sort_key == "urgency":
+        try:
+            return float(val)
+        except:
+            return 0.0
+    # Custom Priority Weighting
+    if sort_key == "priority":
+        # Assign numeric weights so H (3) > M (2) > L (1) > None (0)
+        weights = {"H": 3, "M": 2, "L": 1, "X": 0, "": 0}
+        return weights.get(val, 0)
+
+    return str(val).lower()
+
+
+# --- RENDER PROFILES ---
+class RenderProfile:
+    """How much the UI draws: row markers, frame rate, animations and toasts."""
+
+    def __init__(
+        self,
+        name,
+        markers,
+        max_fps=60,
+        animations=True,
+        blink=True,
+        coalesce_notifications=False,
+        editor_delay=0,
+    ):
+        self.name = name
+        self.markers = markers
+        self.max_fps = max_fps
+        self.animations = animations
+        self.blink = blink
+        self.coalesce_notifications = coalesce_notifications
+        self.editor_delay = (
+            editor_delay  # seconds the cursor rests before the editor follows
+        )
+
+
+PROFILES = {
+    "full": RenderProfile(
+        "full",
+        {
+            "selected": "⭐ ",
+            "started": "▸ ",
+            "completed": "✔ ",
+            "deleted": "✘ ",
+            "blocked": "🔗← ",
+            "blocking": "🔗→ ",
+            "both": "🔗↔ ",
+            "sort_desc": " 🔽",
+            "sort_asc": " 🔼",
+            "expanded": "▾",
+            "collapsed": "▸",
+            "viewing": "🔒 VIEWING",
+            "modifying": "✏️ MODIFYING",
+            "unsaved": "✏️ MODIFYING [b][blink][yellow](UNSAVED)[/][/][/]",
+        },
+    ),
+    # For slow links (SSH): single-width ASCII, 10 frames a second at most, no
+    # animation or blinking, one toast at a time, and the editor panel is only
+    # redrawn once the cursor stops moving
+    "low": RenderProfile(
+        "low",
+        {
+            "selected": "* ",
+            "started": "> ",
+            "completed": "x ",
+            "deleted": "- ",
+            "blocked": "<- ",
+            "blocking": "-> ",
+            "both": "<> ",
+            "sort_desc": " v",
+            "sort_asc": " ^",
+            "expanded": "-",
+            "collapsed": "+",
+            "viewing": "VIEWING",
+            "modifying": "MODIFYING",
+            "unsaved": "MODIFYING [b][yellow](UNSAVED)[/][/]",
+        },
+        max_fps=10,
+        animations=False,
+        blink=False,
+        coalesce_notifications=True,
+        editor_delay=0.2,
+    ),
+}
+
+
+@contextmanager
+def frame_pacing(max_fps):
+    """Cap the screens' update rate at max_fps for the app run inside the block.
+
+    Textual reads the period from a module constant whenever a screen creates
+    its update timer, so it is only overridden while our app runs.
+    """
+    previous = textual_screen.UPDATE_PERIOD
+    textual_screen.UPDATE_PERIOD = 1 / max_fps
+    try:
+        yield
+    finally:
+        textual_screen.UPDATE_PERIOD = previous
+
+
+# --- PROJECT COLOR HASHING ---
+def get_project_color(project_name):
+    if not project_name:
+        return "white"
+    # Use a simple hash to pick a consistent color for the project name
+    idx = sum(ord(c) for c in project_name) % len(PROJECT_COLORS)
+    return PROJECT_COLORS[idx]
+
+
+def format_urgency(urgency_val):
+    # If urgency is above 20, wrap it in a red bold tag
+    urgency_str = f"{urgency_val:.1f}"
+    if urgency_val > 20:
+        return f"[b][red]{urgency_str}[/][/]"
+    return urgency_str
+
+
+# --- PROJECT GROUPS ---
+GROUP_ROW = "group:"  # key prefix of group rows, task rows are keyed by uuid
+
+
+class ProjectGroup:
+    """One level of the project hierarchy, with totals over everything below it."""
+
+    def __init__(self, path):
+        self.path = path  # the full dotted project, "" for tasks without one
+        self.children = {}  # next path component -> ProjectGroup
+        self.uuids = []  # tasks filed directly under this project
+        self.count = 0
+        self.max_urgency = 0.0
+
+
+def group_by_project(tasks):
+    """Nest tasks (in display order) under their dotted project path."""
+    root = ProjectGroup(None)
+    for t in tasks:
+        parts = t.get("project", "").split(".")
+        urgency = sort_value(t, "urgency")
+        group = root
+        for depth, part in enumerate(parts):
+            path = ".".join(parts[: depth + 1])
+            group = group.children.setdefault(part, ProjectGroup(path))
+            group.count += 1
+            group.max_urgency = max(group.max_urgency, urgency)
+        group.uuids.append(t["uuid"])
+    return root
+
+
+# --- HISTORY ---
+class HistoryCache:
+    """Completed/deleted tasks fetched in fixed date windows, newest first.
+
+    Page 0 ends at the next midnight after the cache was created; each page
+    covers `page_days` days further back, so a page's window never moves and
+    a loaded page can be reused as is.
+    """
+
+    FINISHED = ("(", "status:completed", "or", "status:deleted", ")")
+
+    def __init__(self, page_days=30):
+        self.page_days = page_days
+        self.pages = {}
+        self.reset()
+
+    def reset(self):
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.anchor = midnight + timedelta(days=1)
+        self.pages.clear()
+
+    def window(self, index):
+        end = self.anchor - timedelta(days=self.page_days * index)
+        return end - timedelta(days=self.page_days), end
+
+    def load(self, index):
+        if index not in self.pages:
+            start, end = self.window(index)
+            tasks = task_export(
+                *self.FINISHED,
+                # end.after is strict, step back a second to include the boundary
+                f"end.after:{tw_date(start - timedelta(seconds=1))}",
+                f"end.before:{tw_date(end)}",
+            )
+            tasks.sort(key=lambda t: t.get("end", ""), reverse=True)
+            self.pages[index] = tasks
+        return self.pages[index]
+
+    def has_older(self, index):
+        """Whether any task ended before the window of page index."""
+        start, _ = self.window(index)
+        res = task_run(
+            ["task", *self.FINISHED, f"end.before:{tw_date(start)}", "count"]
+        )
+        count = res.stdout.strip()
+        return count.isdigit() and int(count) > 0
+
+    def invalidate_recent(self):
+        """Drop the page that can still receive newly completed tasks."""
+        if datetime.now() >= self.anchor:
+            self.reset()
+        else:
+            self.pages.pop(0, None)
+
+
+class HistoryScreen(ModalScreen):
+    # After this many empty windows in a row, ask whether anything is older
+    MAX_EMPTY_PAGES = 12
+
+    def __init__(self, history, app_ref):
+        super().__init__()
+        self.history = history
+        self.app_ref = app_ref
+        self.next_page = 0
+        self.empty_streak = 0
+        self.loading = False
+        self.exhausted = False
+        self.seen = set()
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="fuzzy_container"):
+            yield Label("📜 HISTORY", id="fuzzy_header")
+            yield Label(
+                "Scroll to load older tasks | [b]Esc[/b] to close", id="fuzzy_help"
+            )
+            yield DataTable(id="history_table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        table = self.query_one("#history_table")
+        for label, key in TASK_COLUMNS + [("End", "end")]:
+            table.add_column(label, key=key)
+        table.focus()
+        self.load_next_page()
+
+    def load_next_page(self) -> None:
+        if self.loading or self.exhausted:
+            return
+        self.loading = True
+        index = self.next_page
+        if index in self.history.pages:
+            self.add_page(index, self.history.pages[index])
+        else:
+            self.query_one("#fuzzy_help").update("⏳ Loading older tasks...")
+            self.fetch_page(index)
+
+    @work(thread=True)
+    def fetch_page(self, index) -> None:
+        tasks = self.history.load(index)
+        self.app.call_from_thread(self.add_page, index, tasks)
+
+    def add_page(self, index, tasks) -> None:
+        table = self.query_one("#history_table")
+        for t in tasks:
+            uuid = t.get("uuid")
+            if uuid in self.seen:
+                continue
+            self.seen.add(uuid)
+            end = (t.get("end", "") or "")[:8]
+            table.add_row(*self.app_ref.format_task_row(t), end, key=uuid)
+
+        self.next_page = index + 1
+        self.empty_streak = 0 if tasks else self.empty_streak + 1
+
+        oldest, _ = self.history.window(index)
+        self.query_one("#fuzzy_header").update(
+            f"📜 HISTORY ({table.row_count} tasks since {oldest:%Y-%m-%d})"
+        )
+        if self.empty_streak >= self.MAX_EMPTY_PAGES:
+            # A long gap (a sabbatical, an old import) is not the end by itself
+            self.query_one("#fuzzy_help").update("⏳ Looking for older tasks...")
+            self.check_older(index)
+            return
+        self.loading = False
+        self.query_one("#fuzzy_help").update(
+            "Scroll to load older tasks | [b]Esc[/b] to close"
+        )
+        # Keep going until the table is filled past the visible area
+        if table.row_count < self.size.height + 5:
+            self.load_next_page()
+
+    @work(thread=True)
+    def check_older(self, index) -> None:
+        older = self.history.has_older(index)
+        self.app.call_from_thread(self.older_checked, older)
+
+    def older_checked(self, older) -> None:
+        self.loading = False
+        self.empty_streak = 0
+        self.exhausted = not older
+        self.query_one("#fuzzy_help").update(
+            "Scroll to load older tasks | [b]Esc[/b] to close"
+            if older
+            else "No older tasks | [b]Esc[/b] to close"
+        )
+        if older:
+            self.load_next_page()
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        table = self.query_one("#history_table")
+        if event.cursor_row >= table.row_count - 5:
+            self.load_next_page()
+
+    def on_key(self, event) -> None:
+        table = self.query_one("#history_table")
+        if event.key == "escape":
+            self.dismiss(None)
+        elif event.key == "j":
+            table.action_cursor_down()
+        elif event.key == "k":
+            table.action_cursor_up()
+        elif event.key == "g":
+            table.move_cursor(row=0)
+        elif event.key == "G":
+            table.move_cursor(row=table.row_count - 1)
+        else:
+            return
+        event.stop()
+
+
+# --- IMPORT ---
+IMPORT_CHUNK = 500  # tasks per `task import` process
+IMPORT_DATES = ("due", "scheduled", "wait", "until", "entry", "start", "end")
+IMPORT_STATUSES = ("pending", "completed", "deleted", "waiting", "recurring")
+
+
+def read_import_rows(path):
+    """Yield (line number, row dict or error) from a JSON-lines or CSV file.
+
+    The file is read as a stream, so nothing holds more than one row.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.lower().endswith(".csv"):
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, {k: v for k, v in row.items() if k and v}
+            return
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                yield line_no, f"invalid JSON: {e}"
+                continue
+            if not isinstance(row, dict):
+                yield line_no, "expected a JSON object"
+                continue
+            yield line_no, row
+
+
+def validate_import_row(row, now=None):
+    """The row as a task ready for `task import`, or raise ValueError."""
+    task = {k: v for k, v in row.items() if v not in ("", None, [])}
+    if not str(task.get("description", "")).strip():
+        raise ValueError("missing description")
+    task["description"] = str(task["description"]).strip()
+    status = task.setdefault("status", "pending")
+    if status not in IMPORT_STATUSES:
+        raise ValueError(f"unknown status {status!r}")
+    if task.get("priority", "H") not in ("H", "M", "L"):
+        raise ValueError(f"unknown priority {task['priority']!r}")
+    # CSV cells hold lists as comma or space separated text
+    for key in ("tags", "depends"):
+        if isinstance(task.get(key), str):
+            task[key] = task[key].replace(",", " ").split()
+    if any(" " in str(tag) for tag in task.get("tags", [])):
+        raise ValueError("tags cannot contain spaces")
+    for key in IMPORT_DATES:
+        if key in task:
+            try:
+                task[key] = tw_date(eval_date(str(task[key]), now=now))
+            except ValueError as e:
+                raise ValueError(f"{key}: {e}") from None
+    if "uuid" in task:
+        try:
+            task["uuid"] = str(uuid_lib.UUID(str(task["uuid"])))
+        except ValueError:
+            raise ValueError(f"invalid uuid {task['uuid']!r}") from None
+    else:
+        # Known uuids let the refresh afterwards export exactly these tasks
+        task["uuid"] = str(uuid_lib.uuid4())
+    task.setdefault("entry", tw_date(now or datetime.now(timezone.utc)))
+    return task
+
+
+def import_tasks(tasks):
+    """Feed tasks to `task import` on stdin; returns {uuid: error} for failures.
+
+    A chunk that Taskwarrior rejects is split in halves and retried, so a
+    bad row costs a few extra processes and its error lands on that row.
+    """
+    res = task_run([*TASK_BULK, "import", "-"], input=json.dumps(tasks))
+    if res.returncode == 0:
+        return {}
+    if len(tasks) == 1:
+        return {tasks[0]["uuid"]: res.stderr.strip() or res.stdout.strip()}
+    half = len(tasks) // 2
+    return {**import_tasks(tasks[:half]), **import_tasks(tasks[half:])}
+
+
+class ImportScreen(ModalScreen):
+    # Valid rows beyond this are counted but not listed; errors are always listed
+    PREVIEW_LIMIT = 500
+
+    def __init__(self, path, app_ref):
+        super().__init__()
+        self.path = path
+        self.app_ref = app_ref
+        self.tasks = []
+        self.rows = {}  # task uuid -> preview row key
+        self.lines = {}  # task uuid -> line in the file
+        self.invalid = 0
+        self.reading = True
+        self.importing = False
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="fuzzy_container"):
+            yield Label(f"📥 IMPORT {os.path.basename(self.path)}", id="fuzzy_header")
+            yield Label("⏳ Reading...", id="fuzzy_help")
+            yield DataTable(id="import_table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        table = self.query_one("#import_table")
+        table.add_column("Line", key="line")
+        table.add_column("", key="state")
+        table.add_column("Description", key="description")
+        table.add_column("Project", key="project")
+        table.add_column("Due", key="due")
+        table.add_column("Error", key="error")
+        table.focus()
+        self.read_file()
+
+    @work(thread=True)
+    def read_file(self) -> None:
+        batch = []
+        try:
+            for line_no, row in read_import_rows(self.path):
+                if isinstance(row, str):
+                    batch.append((line_no, None, row))
+                else:
+                    try:
+                        batch.append((line_no, validate_import_row(row), None))
+                    except ValueError as e:
+                        batch.append((line_no, row, str(e)))
+                if len(batch) >= 200:
+                    self.app.call_from_thread(self.add_rows, batch)
+                    batch = []
+        except (OSError, UnicodeDecodeError, csv.Error) as e:
+            self.app.call_from_thread(self.add_rows, batch, str(e))
+            return
+        self.app.call_from_thread(self.add_rows, batch, None, True)
+
+    def add_rows(self, batch, failure=None, done=False) -> None:
+        table = self.query_one("#import_table")
+        for line_no, task, error in batch:
+            if error is None:
+                self.tasks.append(task)
+                self.lines[task["uuid"]] = line_no
+                if len(self.tasks) > self.PREVIEW_LIMIT:
+                    continue
+                key = f"line-{line_no}"
+                self.rows[task["uuid"]] = key
+                state = "✓"
+            else:
+                self.invalid += 1
+                key, state = None, "❌"
+            task = task or {}
+            due = task.get("due", "")
+            table.add_row(
+                str(line_no),
+                state,
+                str(task.get("description", "")),
+                str(task.get("project", "")),
+                due[:8] if isinstance(due, str) else "",
+                error or "",
+                key=key,
+            )
+        self.update_status()
+        if failure:
+            self.reading = False
+            self.query_one("#fuzzy_help").update(
+                f"[red]❌ {failure}[/] | [b]Esc[/b] to close"
+            )
+        elif done:
+            self.reading = False
+            self.update_status()
+
+    def update_status(self) -> None:
+        valid = len(self.tasks)
+        self.query_one("#fuzzy_header").update(
+            f"📥 IMPORT {os.path.basename(self.path)} "
+            f"({valid} valid, {self.invalid} invalid)"
+        )
+        if self.reading:
+            help_text = "⏳ Reading..."
+        elif valid:
+            help_text = f"[b]Enter[/b] to import {valid} task(s) | [b]Esc[/b] to cancel"
+        else:
+            help_text = "Nothing to import | [b]Esc[/b] to close"
+        self.query_one("#fuzzy_help").update(help_text)
+
+    @work(thread=True)
+    def run_import(self) -> None:
+        errors = {}
+        with self.app_ref.task_lock:
+            for start in range(0, len(self.tasks), IMPORT_CHUNK):
+                errors.update(import_tasks(self.tasks[start : start + IMPORT_CHUNK]))
+                self.app.call_from_thread(
+                    self.query_one("#fuzzy_help").update,
+                    f"⏳ Imported {min(start + IMPORT_CHUNK, len(self.tasks))}"
+                    f"/{len(self.tasks)}...",
+                )
+            uuids = [t["uuid"] for t in self.tasks if t["uuid"] not in errors]
+            exported = export_uuids(uuids)
+        self.app.call_from_thread(self.finish_import, uuids, exported, errors)
+
+    def finish_import(self, uuids, exported, errors) -> None:
+        self.importing = False
+        table = self.query_one("#import_table")
+        for uuid, error in errors.items():
+            if uuid in self.rows:
+                table.update_cell(self.rows[uuid], "state", "❌")
+                table.update_cell(self.rows[uuid], "error", error)
+            else:
+                # Rows past the preview limit are listed once they fail
+                task = next(t for t in self.tasks if t["uuid"] == uuid)
+                table.add_row(
+                    str(self.lines[uuid]),
+                    "❌",
+                    task["description"],
+                    task.get("project", ""),
+                    task.get("due", "")[:8],
+                    error,
+                )
+        if uuids:
+            self.app_ref.undo_log.record(
+                Operation(
+                    f"import of {len(uuids)} task(s)",
+                    "add",
+                    {uuid: {} for uuid in uuids},
+                )
+            )
+            self.app_ref.patch_rows(uuids, exported)
+        self.query_one("#fuzzy_header").update(
+            f"📥 IMPORTED {len(uuids)} task(s), {len(errors) + self.invalid} failed"
+        )
+        self.query_one("#fuzzy_help").update(
+            "[b]Esc[/b] to close" if errors else "✅ Done | [b]Esc[/b] to close"
+        )
+        # Nothing is left to import a second time
+        self.tasks = []
+
+    def on_key(self, event) -> None:
+        table = self.query_one("#import_table")
+        if event.key == "escape":
+            if not self.importing:
+                self.dismiss(None)
+        elif event.key == "enter":
+            if not self.reading and not self.importing and self.tasks:
+                self.importing = True
+                self.run_import()
+        elif event.key == "j":
+            table.action_cursor_down()
+        elif event.key == "k":
+            table.action_cursor_up()
+        else:
+            return
+        event.stop()
 
 
 # --- QUICK MENU MODAL ---
@@ -30,10 +1744,12 @@ class QuickMenuScreen(ModalScreen):
     def compose(self) -> ComposeResult:
         # We reuse your CSS context_bar look
         text = ""
+        # Show the date each choice resolves to, evaluated locally
+        day = lambda expr: self.app_ref.evaluate_due(expr).strftime("%a %d %b")
         if self.menu_type == "main":
-            text = "📅 SET DUE: [[n]] Today | [[t]] Tomorrow | [[e]] End of... | [[Esc]] Cancel"
+            text = f"📅 SET DUE: [[n]] Today ({day('today')}) | [[t]] Tomorrow ({day('tomorrow')}) | [[e]] End of... | [[Esc]] Cancel"
         elif self.menu_type == "end_of":
-            text = "📅 END OF: [[w]] Week | [[m]] Month | [[y]] Year | [[Esc]] Back"
+            text = f"📅 END OF: [[w]] Week ({day('eow')}) | [[m]] Month ({day('eom')}) | [[y]] Year ({day('eoy')}) | [[Esc]] Back"
         elif self.menu_type == "priority":
             text = "⚡ SET PRIO: [[h]] High | [[m]] Mid | [[l]] Low | [[x]] Clear | [[Esc]] Cancel"
 
@@ -89,36 +1805,64 @@ class QuickMenuScreen(ModalScreen):
 
 # --- DEPENDENCY LIST SCREEN ---
 class DependencyListScreen(ModalScreen):
-    def __init__(self, dependencies, all_tasks):
+    MODES = {
+        "f": ("depends", "🔗 DEPENDS ON (blocked by)"),
+        "b": ("blocking", "🔗 BLOCKING"),
+        "a": ("transitive", "🔗 ALL PREREQUISITES"),
+        "c": ("critical", "🔗 CRITICAL PATH"),
+    }
+
+    def __init__(self, uuid, store, mode="depends"):
         super().__init__()
-        self.dependencies = dependencies
-        self.all_tasks = all_tasks
+        self.uuid = uuid
+        self.store = store
+        self.mode = mode
 
     def compose(self) -> ComposeResult:
         with Vertical(id="fuzzy_container"):
             yield Label("🔗 DEPENDENCY LIST", id="fuzzy_header")
             yield Label(
-                "[b]Enter[/b] to jump to task | [b]Esc[/b] to close", id="fuzzy_help"
+                "[b]f[/b] Depends | [b]b[/b] Blocking | [b]a[/b] All | [b]c[/b] Critical path | "
+                "[b]Enter[/b] to jump to task | [b]Esc[/b] to close",
+                id="fuzzy_help",
             )
             yield ListView(id="dep_list")
 
     def on_mount(self) -> None:
+        self.show_mode(self.mode)
+        self.query_one("#dep_list").focus()
+
+    def show_mode(self, mode) -> None:
+        self.mode = mode
+        graph = self.store.graph
+        if mode == "blocking":
+            uuids = graph.blocking(self.uuid)
+        elif mode == "transitive":
+            uuids = graph.transitive(self.uuid)
+        elif mode == "critical":
+            # The chain is listed from the first task to do up to the current one
+            uuids = graph.critical_path(self.uuid)[::-1]
+        else:
+            uuids = graph.depends_on(self.uuid)
+        title = next(t for m, t in self.MODES.values() if m == mode)
+        self.query_one("#fuzzy_header").update(f"{title} ({len(uuids)})")
+
         list_view = self.query_one("#dep_list")
-        dep_set = {str(d) for d in self.dependencies}
-        found = False
-        for t in self.all_tasks:
-            if str(t.get("id")) in dep_set or t.get("uuid") in dep_set:
-                item = ListItem(
-                    Static(
-                        f"{t.get('id')} - {t.get('description')} [dim]({t.get('project', '')})[/dim]"
-                    )
+        list_view.clear()
+        for uuid in uuids:
+            t = self.store.get(uuid)
+            if not t:
+                continue
+            marker = "▸ " if uuid == self.uuid else ""
+            item = ListItem(
+                Static(
+                    f"{marker}{t.get('id')} - {t.get('description')} [dim]({t.get('project', '')})[/dim]"
                 )
-                item.uuid = t.get("uuid")
-                list_view.append(item)
-                found = True
-        if not found:
+            )
+            item.uuid = uuid
+            list_view.append(item)
+        if not uuids:
             list_view.append(ListItem(Static("No active dependencies found.")))
-        list_view.focus()
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if hasattr(event.item, "uuid"):
@@ -129,10 +1873,199 @@ class DependencyListScreen(ModalScreen):
     def on_key(self, event) -> None:
         if event.key == "escape":
             self.dismiss(None)
+        elif event.key in self.MODES:
+            self.show_mode(self.MODES[event.key][0])
+            event.stop()
+
+
+# --- MERGE VIEW ---
+EDITOR_FIELDS = ("description", "project", "due", "tags", "depends", "priority")
+
+
+def editable_values(task):
+    """The editor's fields of a task, in the same form editor_fields() returns."""
+    return {
+        "description": task.get("description", ""),
+        "project": task.get("project", ""),
+        "due": task.get("due") or None,
+        "tags": list(task.get("tags", [])),
+        "depends": parse_depends(task.get("depends")),
+        "priority": task.get("priority") or None,
+    }
+
+
+class MergeScreen(ModalScreen):
+    """Side by side view of an edit and a change made elsewhere since loading."""
+
+    def __init__(self, loaded, theirs, mine):
+        super().__init__()
+        self.loaded = editable_values(loaded)
+        self.theirs = editable_values(theirs)
+        self.mine = mine  # only the fields changed in the editor
+
+    def compose(self) -> ComposeResult:
+        with Vertical(id="fuzzy_container"):
+            yield Label("⚠️ TASK CHANGED SINCE IT WAS LOADED", id="fuzzy_header")
+            yield Label(
+                "[b]m[/b] Apply my changes on top of theirs | [b]t[/b] Take theirs | "
+                "[b]Esc[/b] Back to editing",
+                id="fuzzy_help",
+            )
+            yield DataTable(id="merge_table", cursor_type="row")
+
+    def on_mount(self) -> None:
+        def show(value):
+            if isinstance(value, list):
+                return ", ".join(map(str, value))
+            return "" if value is None else str(value)
+
+        table = self.query_one("#merge_table")
+        table.add_columns("", "Field", "Loaded", "Theirs", "Mine")
+        for key in EDITOR_FIELDS:
+            theirs_changed = self.theirs[key] != self.loaded[key]
+            if not theirs_changed and key not in self.mine:
+                continue
+            # Both sides touched the field and disagree: applying mine drops theirs
+            clash = (
+                theirs_changed
+                and key in self.mine
+                and self.mine[key] != self.theirs[key]
+            )
+            table.add_row(
+                "⚠️" if clash else "",
+                key,
+                show(self.loaded[key]),
+                show(self.theirs[key]) if theirs_changed else "[dim]—[/dim]",
+                show(self.mine[key]) if key in self.mine else "[dim]—[/dim]",
+            )
+        table.focus()
+
+    def on_key(self, event) -> None:
+        if event.key == "escape":
+            self.dismiss(None)
+        elif event.key == "m":
+            self.dismiss("mine")
+        elif event.key == "t":
+            self.dismiss("theirs")
+
+
+# --- SEARCH INDEX ---
+class SearchIndex:
+    """Full-text index of every task, whatever its status, in SQLite FTS5.
+
+    It lives in the cache dir and is caught up with one
+    `modified.after:<newest stamp seen>` export, so only tasks changed since
+    the last sync are re-indexed. Queries are ranked with bm25 (description
+    weighs most) and every word matches as a prefix.
+    """
+
+    LIMIT = 50
+
+    def __init__(self, path=None):
+        cache_dir = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        self.path = path or os.path.join(cache_dir, "task-tui", "search.db")
+        self.reader = None  # the UI thread's connection, sync opens its own
+        self.ready = False
+
+    def connect(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS docs (
+                rowid INTEGER PRIMARY KEY, uuid TEXT UNIQUE, status TEXT, id INTEGER
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+                description, annotations, tags, project,
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            );
+            """)
+        return db
+
+    def sync(self):
+        """Index the tasks modified since the last sync; returns how many."""
+        with closing(self.connect()) as db, db:
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+            location = load_task_config().get("data.location", "")
+            if meta.get("location") != location:
+                # Another task database, start over
+                db.execute("DELETE FROM docs")
+                db.execute("DELETE FROM search")
+                meta = {}
+            since = parse_tw_date(meta.get("modified"))
+            if since:
+                # modified.after is strict, step back a second to include the boundary
+                after = tw_date(since - timedelta(seconds=1))
+                tasks = task_export(f"modified.after:{after}")
+            else:
+                tasks = task_export()
+            newest = meta.get("modified", "")
+            for t in tasks:
+                self.put(db, t)
+                newest = max(newest, t.get("modified") or t.get("entry", ""))
+            db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [("location", location), ("modified", newest)],
+            )
+        self.ready = True
+        return len(tasks)
+
+    def put(self, db, t):
+        row = db.execute(
+            "SELECT rowid FROM docs WHERE uuid = ?", (t["uuid"],)
+        ).fetchone()
+        if row:
+            rowid = row[0]
+            db.execute(
+                "UPDATE docs SET status = ?, id = ? WHERE rowid = ?",
+                (t.get("status", ""), t.get("id") or 0, rowid),
+            )
+            db.execute("DELETE FROM search WHERE rowid = ?", (rowid,))
+        else:
+            rowid = db.execute(
+                "INSERT INTO docs (uuid, status, id) VALUES (?, ?, ?)",
+                (t["uuid"], t.get("status", ""), t.get("id") or 0),
+            ).lastrowid
+        db.execute(
+            "INSERT INTO search (rowid, description, annotations, tags, project)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (
+                rowid,
+                t.get("description", ""),
+                " ".join(a.get("description", "") for a in t.get("annotations", [])),
+                " ".join(t.get("tags", [])),
+                t.get("project", ""),
+            ),
+        )
+
+    def query(self, text):
+        """Best matches as (uuid, status, id, description, project) rows."""
+        words = re.findall(r"\w+", text)
+        if not words:
+            return []
+        if self.reader is None:
+            self.reader = self.connect()
+        match = " ".join(f'"{w}"*' for w in words)
+        return self.reader.execute(
+            "SELECT docs.uuid, docs.status, docs.id, search.description, search.project"
+            " FROM search JOIN docs ON docs.rowid = search.rowid"
+            " WHERE search MATCH ? ORDER BY bm25(search, 10.0, 4.0, 6.0, 6.0) LIMIT ?",
+            (match, self.LIMIT),
+        ).fetchall()
 
 
 # --- FUZZY SEARCH MODAL ---
 class FuzzySearchScreen(ModalScreen):
+    # Mounting list items is what costs, only the best matches are shown
+    LIMIT = 50
+
+    def __init__(self, store, index=None):
+        super().__init__()
+        self.store = store
+        self.index = index  # None to search the pending tasks only
+        self.ranked = None  # pending uuids by urgency, sorted on first use
+
     def compose(self) -> ComposeResult:
         with Vertical(id="fuzzy_container"):
             yield Label("🔍 TASK SEARCH", id="fuzzy_header")
@@ -141,14 +2074,37 @@ class FuzzySearchScreen(ModalScreen):
                 id="fuzzy_help",
             )
             yield Input(
-                placeholder="Search description or project...", id="fuzzy_input"
+                placeholder="Search description, annotations, tags or project...",
+                id="fuzzy_input",
             )
             yield ListView(id="fuzzy_list")
 
     def on_mount(self) -> None:
-        self.all_tasks = self.load_tasks()
         self.update_list("")
         self.query_one("#fuzzy_input").focus()
+        if self.index is not None:
+            self.query_one("#fuzzy_help").update(
+                "⏳ Updating the search index... | [b]Esc[/b] to cancel"
+            )
+            self.sync_index()
+
+    @work(thread=True, exclusive=True, group="search_index")
+    def sync_index(self) -> None:
+        try:
+            self.index.sync()
+        except sqlite3.Error as e:
+            self.app.call_from_thread(
+                self.query_one("#fuzzy_help").update,
+                f"[red]⚠ Search index unavailable: {e}[/] | [b]Esc[/b] to cancel",
+            )
+            return
+        self.app.call_from_thread(self.index_synced)
+
+    def index_synced(self) -> None:
+        self.query_one("#fuzzy_help").update(
+            "Type to filter (all statuses) | [b]Enter[/b] to select | [b]Esc[/b] to cancel"
+        )
+        self.update_list(self.query_one("#fuzzy_input").value)
 
     def on_key(self, event) -> None:
         """Handle Vim-like navigation in the search results."""
@@ -163,30 +2119,59 @@ class FuzzySearchScreen(ModalScreen):
         elif event.key == "escape":
             self.dismiss(None)
 
-    def load_tasks(self):
-        res = subprocess.run(
-            ["task", "status:pending", "export", "rc.json.array=on"],
-            capture_output=True,
-            text=True,
-        )
-        try:
-            return json.loads(res.stdout)
-        except:
-            return []
-
     def on_input_changed(self, event: Input.Changed) -> None:
-        self.update_list(event.value.lower())
+        self.update_list(event.value)
+
+    def matches(self, search_term):
+        """(uuid, status, id, description, project) rows for the search term."""
+        if search_term.strip() and self.index is not None and self.index.ready:
+            try:
+                return self.index.query(search_term)
+            except sqlite3.Error:
+                pass
+        # Pending tasks from memory until the index is ready, or with no term
+        term = search_term.lower()
+        rows = []
+        if self.ranked is None:
+            # Once per screen, not once per keystroke
+            tasks = sorted(
+                self.store.tasks(), key=lambda t: sort_value(t, "urgency"), reverse=True
+            )
+            self.ranked = [t["uuid"] for t in tasks]
+        for uuid in self.ranked:
+            if len(rows) >= self.LIMIT:
+                break
+            t = self.store.get(uuid)
+            if t is None:
+                continue
+            text = " ".join(
+                [t.get("description", ""), t.get("project", "")]
+                + t.get("tags", [])
+                + [a.get("description", "") for a in t.get("annotations", [])]
+            )
+            if term in text.lower():
+                rows.append(
+                    (
+                        t["uuid"],
+                        "pending",
+                        t.get("id"),
+                        t.get("description", ""),
+                        t.get("project", ""),
+                    )
+                )
+        return rows
 
     def update_list(self, search_term: str) -> None:
         list_view = self.query_one("#fuzzy_list")
         list_view.clear()
-        for t in self.all_tasks:
-            desc = t.get("description", "")
-            proj = t.get("project", "")
-            if search_term in desc.lower() or search_term in proj.lower():
-                item = ListItem(Static(f"{t.get('id')} - {desc} [dim]({proj})[/dim]"))
-                item.uuid = t.get("uuid")
-                list_view.append(item)
+        for uuid, status, ident, desc, proj in self.matches(search_term):
+            if status == "completed":
+                ident = f"✔ {uuid[:8]}"
+            elif status == "deleted":
+                ident = f"✘ {uuid[:8]}"
+            item = ListItem(Static(f"{ident} - {desc} [dim]({proj})[/dim]"))
+            item.uuid = uuid
+            list_view.append(item)
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         self.dismiss(event.item.uuid)
@@ -198,7 +2183,10 @@ class TaskProApp(App):
     #fuzzy_container { background: $surface; border: thick $primary; width: 70%; height: 70%; align: center middle; padding: 1; }
     #fuzzy_header { text-align: center; text-style: bold; color: $accent; }
     #fuzzy_help { text-align: center; color: $text-muted; margin-bottom: 1; }
-    #fuzzy_list, #dep_list { height: 1fr; margin-top: 1; border: solid $accent; }
+    #prompt_container { background: $surface; border: thick $primary; width: 60%; height: auto; padding: 1; }
+    #workspace_tabs { height: 2; }
+    #summary_panel { width: 30; border: tall $accent; padding: 0 1; display: none; overflow-y: auto; }
+    #fuzzy_list, #dep_list, #history_table, #merge_table, #import_table { height: 1fr; margin-top: 1; border: solid $accent; }
     
     Screen { layout: vertical; }
     #workspace { height: 75%; layout: horizontal; }
@@ -211,6 +2199,7 @@ class TaskProApp(App):
     #mode_indicator { text-align: center; text-style: bold; margin-bottom: 1; }
     .metadata { color: #888888; text-style: bold; margin-top: 1; }
     Input, Select, TextArea { border: tall $primary; margin-bottom: 0; }
+    .hint { color: $text-muted; height: auto; }
     
     #context_bar { background: $accent; color: white; content-align: center middle; text-style: bold; display: none; height: 1; width: 100%; padding: 0 1; }
     .visible { display: block !important; }
@@ -220,7 +2209,21 @@ class TaskProApp(App):
         Binding("/", "fuzzy_find", "Search"),
         Binding("v", "view_dependencies", "ViewDeps"),
         Binding("u", "undo", "Undo"),
+        Binding("U", "redo", "Redo"),
+        Binding("H", "history", "History"),
+        Binding("I", "import_tasks", "Import"),
+        Binding("W", "new_workspace", "NewView"),
+        Binding("o", "toggle_summary", "Summary"),
+        Binding("z", "toggle_grouped", "Group"),
+        Binding("Z", "toggle_all_groups", "OpenAll", show=False),
+        Binding("M", "memory_report", "Memory", show=False),
+        Binding("right_square_bracket", "next_workspace", "NextView", show=False),
+        Binding("left_square_bracket", "prev_workspace", "PrevView", show=False),
+        Binding("ctrl+w", "close_workspace", "CloseView", show=False),
         Binding("space", "toggle_selection", "Select"),
+        Binding("V", "toggle_visual", "Visual"),
+        Binding("A", "select_all_visible", "SelectAll", show=False),
+        Binding("F", "select_by_filter", "SelectWhere", show=False),
         Binding("t", "date_mode", "SetDate"),
         Binding("p", "prio_mode", "SetPrio"),
         Binding("i", "edit_mode", "Modify/Edit"),
@@ -241,35 +2244,69 @@ class TaskProApp(App):
 
     is_dirty = False  # Track if changes exist
 
-    def __init__(self):
+    def __init__(self, profile=None):
         super().__init__()
+        self.profile = profile or PROFILES["full"]
+        if not self.profile.animations:
+            self.animation_level = "none"
+        self.column_labels = None
+        self.last_notice = (None, 0)  # message and repeat count of the last toast
+        self.editor_timer = None
+        self.visual_anchor = None  # row index where visual mode started
+        self.visual_base = set()  # the selection before visual mode
+        self.count_digits = ""  # a count prefix being typed (the 10 of 10d)
+        self.count = None  # the count for the action of the current key
         self.active_uuid = None
-        self.selected_uuids = set()
+        self.loaded_task = {}  # the task as the editor loaded it
         self.is_modifying = False
-        self.sort_state = {"index": 5, "reverse": True}
-        self.raw_tasks = []
+        self.row_sort_values = {}
+        self.store = TaskStore()
+        self.workspaces = [Workspace("All")]
+        self.workspace_index = 0
+        self.store.listeners.append(self.workspaces[0])
+        self.workspace_counter = 0
+        self.summary_timer = None
+        self.urgency = UrgencyModel()
+        self.task_lock = threading.Lock()
+        self.undo_log = OperationLog()
+        self.history = HistoryCache()
+        self.search_index = SearchIndex()
         self.date_context = None
 
     def compose(self) -> ComposeResult:
         yield Header()
         yield Static("", id="context_bar")
+        yield Tabs(Tab("All", id="ws-0"), id="workspace_tabs")
         with Horizontal(id="workspace"):
             yield DataTable(id="list_panel", cursor_type="row")
             with Vertical(id="editor_panel", classes="view_mode"):
-                yield Static("🔒 VIEWING", id="mode_indicator")
+                yield Static(self.profile.markers["viewing"], id="mode_indicator")
                 yield Label("DESCRIPTION", classes="metadata")
                 yield Input(id="inp_desc", disabled=True)  # Add read_only=True
                 yield Label("PROJECT", classes="metadata")
-                yield Input(id="inp_proj", disabled=True)
+                yield Input(
+                    id="inp_proj",
+                    disabled=True,
+                    suggester=TrieSuggester(self.store.completion.projects),
+                )
                 yield Label(
                     "DUE (YYYYMMDD or e.g. 'tomorrow', 'eo[d,m,y]')",
                     classes="metadata",
                 )
                 yield Input(id="inp_due", disabled=True)
-                yield Label("DEPENDS ON (Ctrl+F to pick tasks)", classes="metadata")
+                yield Static("", id="due_preview", classes="hint")
+                yield Label(
+                    "DEPENDS ON (Ctrl+F to pick tasks, Tab to complete)",
+                    classes="metadata",
+                )
                 yield Input(id="inp_dep", disabled=True)
+                yield Static("", id="dep_hint", classes="hint")
                 yield Label("TAGS", classes="metadata")
-                yield Input(id="inp_tags", disabled=True)
+                yield Input(
+                    id="inp_tags",
+                    disabled=True,
+                    suggester=TrieSuggester(self.store.completion.tags, multi=True),
+                )
                 yield Label("PRIORITY", classes="metadata")
                 yield Select(
                     [("High", "H"), ("Mid", "M"), ("Low", "L"), ("None", "X")],
@@ -279,6 +2316,7 @@ class TaskProApp(App):
                 )
                 yield Label("UUID", classes="metadata")
                 yield Static("None", id="uuid_display")
+            yield Static("", id="summary_panel")
         yield Static("DEBUG LOG", id="debug_panel")
         yield Footer()
 
@@ -312,9 +2350,102 @@ class TaskProApp(App):
     #     yield Footer()
 
     def on_mount(self) -> None:
+        self.workspaces[0].tab_id = "ws-0"
         self.refresh_tasks()
+        if hasattr(backend, "watch"):
+            self.watch_daemon()
+
+    def action_memory_report(self) -> None:
+        if not tracemalloc.is_tracing():
+            self.notify(
+                "Start task-tui with --memory-report to trace memory",
+                severity="warning",
+            )
+            return
+        self.query_one("#debug_panel").update("⏳ Measuring memory...")
+        self.measure_memory()
+
+    @work(thread=True, exclusive=True, group="memory")
+    def measure_memory(self) -> None:
+        from task_tui.memcheck import Attribution, format_breakdown
+
+        sizes = Attribution().breakdown(tracemalloc.take_snapshot())
+        self.call_from_thread(
+            self.query_one("#debug_panel").update, f"🧠 {format_breakdown(sizes)}"
+        )
+
+    def action_toggle_summary(self):
+        panel = self.query_one("#summary_panel")
+        panel.toggle_class("visible")
+        if panel.has_class("visible"):
+            self.update_summary()
+            # Overdue/due-today move with the clock, not only with the data
+            self.summary_timer = self.set_interval(60, self.update_summary)
+        elif self.summary_timer:
+            self.summary_timer.stop()
+            self.summary_timer = None
+
+    def update_summary(self) -> None:
+        panel = self.query_one("#summary_panel")
+        if not panel.has_class("visible"):
+            return
+        summary = self.store.summary
+        overdue, due_today = summary.due_counts()
+        blocked = self.store.graph.blocked_count()
+        lines = [
+            "[b]📊 SUMMARY[/b]",
+            f"Pending   [b]{summary.pending}[/b]",
+            f"Active    [b]{summary.active}[/b]",
+            f"Overdue   [b][red]{overdue}[/][/b]",
+            f"Due today [b][yellow]{due_today}[/][/b]",
+            f"Blocked   [b]{blocked}[/b]",
+            "",
+            "[b]PROJECTS[/b]",
+        ]
+        projects = sorted(summary.by_project.items(), key=lambda kv: (-kv[1], kv[0]))
+        for name, count in projects[:15]:
+            label = name or "(none)"
+            lines.append(f"[{get_project_color(name)}]{label[:20]:<20}[/] {count:>4}")
+        if len(projects) > 15:
+            lines.append(f"[dim]+{len(projects) - 15} more[/dim]")
+        lines += ["", "[b]URGENCY[/b]"]
+        top = max(summary.urgency.values(), default=0) or 1
+        for _, label in SummaryCounters.URGENCY_BUCKETS:
+            count = summary.urgency[label]
+            bar = "█" * round(12 * count / top)
+            lines.append(f"{label:>5} {bar:<12} {count}")
+        panel.update("\n".join(lines))
+
+    @work(exclusive=True, group="daemon")
+    async def watch_daemon(self) -> None:
+        """Reconcile whenever the daemon reports changed data (from any instance)."""
+        generation = 0
+        while True:
+            try:
+                new_generation = await backend.watch(generation)
+            except (OSError, ValueError):
+                return
+            if new_generation != generation:
+                if generation:
+                    tasks = await asyncio.to_thread(task_export, "status:pending")
+                    self.reconcile(tasks)
+                generation = new_generation
+
+    @property
+    def workspace(self):
+        return self.workspaces[self.workspace_index]
+
+    @property
+    def sort_state(self):
+        return self.workspace.sort_state
+
+    @property
+    def selected_uuids(self):
+        return self.workspace.selected_uuids
 
     def on_unmount(self) -> None:
+        if self.editor_timer:
+            self.editor_timer.stop()
         # Clear the TUI screen so the output below is visible
         os.system("clear")
 
@@ -328,6 +2459,18 @@ class TaskProApp(App):
         except Exception:
             print("❌ Sync skipped or failed.")
 
+    def notify(self, message, *, severity="information", **kwargs) -> None:
+        if self.profile.coalesce_notifications:
+            # One toast at a time, a repeated message only bumps its count
+            last, count = self.last_notice
+            count = count + 1 if message == last else 1
+            self.last_notice = (message, count)
+            # Toasts are added through the message queue, so clear through it too
+            self.call_later(self.clear_notifications)
+            if count > 1:
+                message = f"{message} (x{count})"
+        super().notify(message, severity=severity, **kwargs)
+
     def on_key(self, event) -> None:
         # # 1. Handle Context Modes (Date/Priority) first to "trap" keys
         # if self.date_context:
@@ -379,6 +2522,23 @@ class TaskProApp(App):
         #         event.stop()  # Prevents 'x' from Saving or Marking Done
         #         return
         #
+        if not self.is_modifying:
+            # A count typed before a key (5j, 10d) is handed to that key's action
+            self.count = int(self.count_digits) if self.count_digits else None
+            digit = (event.character or "").isdigit()
+            if digit and (self.count_digits or event.character != "0"):
+                self.count_digits += event.character
+                self.update_context_bar()
+                event.stop()
+                return
+            if self.count_digits:
+                self.count_digits = ""
+                self.update_context_bar()
+            if event.key == "escape" and self.visual_anchor is not None:
+                self.cancel_visual()
+                event.stop()
+                return
+
         # 2. Existing Global Guards (Locked Interface)
         if not self.is_modifying and len(event.character or "") == 1:
             is_bound = any(binding.key == event.key for binding in self.BINDINGS)
@@ -396,6 +2556,11 @@ class TaskProApp(App):
         if self.is_modifying and event.key == "ctrl+f" and self.focused.id == "inp_dep":
             self.action_fuzzy_find_dep()
 
+        if self.is_modifying and event.key == "tab" and self.focused.id == "inp_dep":
+            if self.complete_dependency():
+                event.stop()
+                event.prevent_default()
+
     # def on_key(self, event) -> None:
     #     # Force Save even when inside an Input field
     #     if event.key == "S":  # Shift+S
@@ -487,6 +2652,9 @@ class TaskProApp(App):
     #
     def on_descendant_focus(self, event) -> None:
         """Fires whenever a widget inside the app gets focus."""
+        # A blinking cursor is a repaint twice a second for as long as it has focus
+        if not self.profile.blink and isinstance(event.control, Input):
+            event.control.cursor_blink = False
         if isinstance(event.control, DataTable) and self.is_dirty:
             self.notify(
                 "⚠️ UNSAVED CHANGES! Press 'x' to save or 'Ctrl+Z' to discard.",
@@ -496,15 +2664,67 @@ class TaskProApp(App):
             # We allow focus to stay on the DataTable so 'x' works.
             #
 
-    def on_input_changed(self) -> None:
-        if self.is_modifying:
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "inp_dep":
+            self.update_dep_hint(event.value)
+        elif event.input.id == "inp_due":
+            self.update_due_preview(event.value)
+        if self.is_modifying and not self.is_dirty:
             self.is_dirty = True
             # self.query_one("#mode_indicator").update(
             #     "✏️ MODIFYING [b][yellow](UNSAVED)[/][/]"
             # )
-            self.query_one("#mode_indicator").update(
-                "✏️ MODIFYING [b][blink][yellow](UNSAVED)[/][/][/]"
+            # Only the first change repaints the indicator
+            self.query_one("#mode_indicator").update(self.profile.markers["unsaved"])
+
+    def evaluate_due(self, expr, uuid=None):
+        """eval_date with the task's current due as `due` and the rc weekstart."""
+        task = self.store.get(uuid or self.active_uuid) or {}
+        base = parse_tw_date(task.get("due"))
+        return eval_date(
+            expr,
+            base=base,
+            weekstart=load_task_config().get("weekstart", "sunday"),
+        )
+
+    def update_due_preview(self, value):
+        preview = self.query_one("#due_preview")
+        if not self.is_modifying or not value.strip():
+            preview.update("")
+            return
+        try:
+            preview.update(f"→ {self.evaluate_due(value):%a %Y-%m-%d %H:%M}")
+        except ValueError as e:
+            preview.update(f"[yellow]⚠ {e}, Taskwarrior will read it on save[/]")
+
+    def dependency_matches(self, value):
+        """Tasks matching the dependency word being typed (by id or description)."""
+        word = value.rpartition(",")[2].strip()
+        if not word:
+            return []
+        uuids = self.store.completion.tasks.complete(word, 5)
+        return [u for u in uuids if u != self.active_uuid and self.store.get(u)]
+
+    def update_dep_hint(self, value):
+        hint = self.query_one("#dep_hint")
+        matches = self.dependency_matches(value) if self.is_modifying else []
+        hint.update(
+            "  ".join(
+                f"[b]{self.store.get(u).get('id')}[/b] {self.store.get(u).get('description', '')[:30]}"
+                for u in matches
             )
+        )
+
+    def complete_dependency(self):
+        """Replace the word being typed in #inp_dep by the best match's uuid."""
+        inp = self.query_one("#inp_dep")
+        matches = self.dependency_matches(inp.value)
+        if not matches:
+            return False
+        head = inp.value.rpartition(",")[0]
+        inp.value = f"{head}, {matches[0]}" if head.strip() else matches[0]
+        inp.cursor_position = len(inp.value)
+        return True
 
     def on_select_changed(self) -> None:
         if self.is_modifying:
@@ -528,10 +2748,20 @@ class TaskProApp(App):
     #
     # --- ACTIONS ---
     def action_cursor_down(self):
-        self.query_one(DataTable).action_cursor_down()
+        table = self.query_one(DataTable)
+        count, self.count = self.count, None
+        if count:
+            table.move_cursor(row=min(table.cursor_row + count, table.row_count - 1))
+        else:
+            table.action_cursor_down()
 
     def action_cursor_up(self):
-        self.query_one(DataTable).action_cursor_up()
+        table = self.query_one(DataTable)
+        count, self.count = self.count, None
+        if count:
+            table.move_cursor(row=max(table.cursor_row - count, 0))
+        else:
+            table.action_cursor_up()
 
     def action_cursor_left(self):
         self.query_one(DataTable).action_cursor_left()
@@ -540,23 +2770,64 @@ class TaskProApp(App):
         self.query_one(DataTable).action_cursor_right()
 
     def action_scroll_top(self):
+        if self.count:
+            self.action_go_to_row()
+            return
         self.query_one(DataTable).scroll_home()
         self.query_one(DataTable).move_cursor(row=0)
 
     def action_scroll_bottom(self):
+        if self.count:
+            self.action_go_to_row()
+            return
         self.query_one(DataTable).scroll_end()
-        self.query_one(DataTable).move_cursor(row=len(self.raw_tasks) - 1)
+        self.query_one(DataTable).move_cursor(
+            row=self.query_one(DataTable).row_count - 1
+        )
 
     def action_undo(self):
-        subprocess.run(["task", "rc.confirmation=off", "undo"])
-        self.refresh_tasks()
-        self.notify("Last action undone")
+        op = self.undo_log.undo()
+        if op is None:
+            # Nothing recorded this session, fall back to Taskwarrior's own undo
+            task_run(["task", "rc.confirmation=off", "undo"])
+            self.refresh_tasks()
+            self.notify("Last action undone")
+            return
+        self.run_and_patch(op.undo_commands(), op.uuids)
+        self.notify(f"↶ Undone: {op.label} ({len(self.undo_log.done)} left)")
+
+    def action_redo(self):
+        op = self.undo_log.redo()
+        if op is None:
+            self.notify("Nothing to redo", severity="warning")
+            return
+        self.run_and_patch(op.redo_commands(), op.uuids)
+        self.notify(f"↷ Redone: {op.label}")
+
+    def record_modify(self, label, uuids, after):
+        """Log a modification with the current values of the fields it changes."""
+        before = {}
+        for uuid in uuids:
+            task = self.store.get(uuid)
+            if task:
+                before[uuid] = {key: task.get(key, "") for key in after}
+        if before:
+            self.undo_log.record(
+                Operation(label, "modify", before, {uuid: after for uuid in before})
+            )
 
     def action_view_dependencies(self):
         if not self.active_uuid or self.active_uuid == "NEW":
             return
-        task = next((t for t in self.raw_tasks if t["uuid"] == self.active_uuid), None)
-        if task and "depends" in task:
+        if self.store.get(self.active_uuid):
+            graph = self.store.graph
+            # Open on whichever side of the graph actually has something to show
+            mode = (
+                "blocking"
+                if graph.is_blocking(self.active_uuid)
+                and not graph.is_blocked(self.active_uuid)
+                else "depends"
+            )
 
             def on_jump_to(uuid):
                 if uuid:
@@ -567,12 +2838,30 @@ class TaskProApp(App):
                             break
 
             self.push_screen(
-                DependencyListScreen(task["depends"], self.raw_tasks), on_jump_to
+                DependencyListScreen(self.active_uuid, self.store, mode), on_jump_to
             )
 
+    def action_history(self):
+        self.push_screen(HistoryScreen(self.history, self))
+
+    def action_import_tasks(self):
+        def on_path(path):
+            if not path or not path.strip():
+                return
+            path = os.path.expanduser(path.strip())
+            if not os.path.isfile(path):
+                self.notify(f"No such file: {path}", severity="error")
+                return
+            self.push_screen(ImportScreen(path, self))
+
+        self.push_screen(
+            PromptScreen("📥 IMPORT FILE (.jsonl or .csv)", "~/tasks.jsonl"), on_path
+        )
+
     def action_new_task(self):
         self.set_modify_mode(True)
         self.active_uuid = "NEW"
+        self.loaded_task = {}
         for field in ["#inp_desc", "#inp_proj", "#inp_due", "#inp_dep", "#inp_tags"]:
             self.query_one(field).value = ""
         self.query_one("#uuid_display").update("NEW TASK")
@@ -581,31 +2870,35 @@ class TaskProApp(App):
     def action_toggle_start(self):
         if not self.active_uuid or self.active_uuid == "NEW":
             return
-        task = next((t for t in self.raw_tasks if t["uuid"] == self.active_uuid), None)
+        task = self.store.get(self.active_uuid)
         if task:
             cmd = "stop" if task.get("start") else "start"
-            subprocess.run(["task", self.active_uuid, cmd])
-            self.refresh_tasks()
+            start = None if task.get("start") else tw_date(datetime.now())
+            self.record_modify(
+                f"{cmd} task {task.get('id')}", [self.active_uuid], {"start": start}
+            )
+            self.apply_local_edit([self.active_uuid], {"start": start})
+            self.run_in_background([["task", self.active_uuid, cmd]])
 
     def action_mark_done(self):
-        # 1. Determine which tasks to complete
-        targets = (
-            list(self.selected_uuids) if self.selected_uuids else [self.active_uuid]
-        )
-
-        # 2. Guard against empty selection or "NEW" task
-        targets = [uid for uid in targets if uid and uid != "NEW"]
+        # 1. Determine which tasks to complete (never the "NEW" task)
+        targets = self.action_targets()
 
         if not targets:
             return
 
-        # 3. Execute 'done' for each task
-        for uid in targets:
-            subprocess.run(["task", uid, "done"])
+        # 3. Execute 'done' for all of them in a single command
+        self.undo_log.record(
+            Operation(
+                f"done on {len(targets)} task(s)", "done", {u: {} for u in targets}
+            )
+        )
+        self.run_and_patch([[*TASK_BULK, *targets, "done"]], targets)
+        self.patch_rows(targets, [])
 
         # 4. Cleanup
-        self.selected_uuids.clear()  # Clear selection after action
-        self.refresh_tasks()
+        self.set_selection(set())  # Clear selection after action
+        self.history.invalidate_recent()
         self.notify(f"Completed {len(targets)} task(s)!")
 
     #
@@ -618,7 +2911,10 @@ class TaskProApp(App):
 
     def action_fuzzy_find(self):
         def on_select(uuid):
-            if uuid:
+            if uuid and not self.store.get(uuid):
+                # Completed/deleted tasks are only in the index
+                self.notify(f"{uuid[:8]} is not pending, see the history (H).")
+            elif uuid:
                 self.load_task_by_uuid(uuid, focus=False)
                 table = self.query_one(DataTable)
                 for idx, row_key in enumerate(table.rows):
@@ -626,7 +2922,7 @@ class TaskProApp(App):
                         table.move_cursor(row=idx)
                         break
 
-        self.push_screen(FuzzySearchScreen(), on_select)
+        self.push_screen(FuzzySearchScreen(self.store, self.search_index), on_select)
 
     def action_fuzzy_find_dep(self):
         def on_select(selected_uuid):
@@ -636,15 +2932,117 @@ class TaskProApp(App):
                 new_val = f"{current}, {selected_uuid}" if current else selected_uuid
                 self.query_one("#inp_dep").value = new_val.strip(", ")
 
-        self.push_screen(FuzzySearchScreen(), on_select)
+        self.push_screen(FuzzySearchScreen(self.store), on_select)
 
     def action_toggle_selection(self):
-        if self.active_uuid and self.active_uuid != "NEW":
-            if self.active_uuid in self.selected_uuids:
-                self.selected_uuids.remove(self.active_uuid)
-            else:
-                self.selected_uuids.add(self.active_uuid)
-            self.update_table_view()
+        count, self.count = self.count, None
+        uuids = self.counted_rows(count) if count else [self.active_uuid]
+        # Every row flips on its own, as if space was pressed on each
+        flipped = {uid for uid in uuids if uid and uid != "NEW"}
+        self.set_selection(self.selected_uuids ^ flipped)
+
+    def action_select_all_visible(self):
+        rows = set(self.task_rows_on_screen())
+        # Pressed again with everything selected, it clears them
+        if rows <= self.selected_uuids:
+            self.set_selection(self.selected_uuids - rows)
+        else:
+            self.set_selection(self.selected_uuids | rows)
+
+    def action_select_by_filter(self):
+        def on_filter(text):
+            if not text or not text.strip():
+                return
+            terms = parse_filter(text)
+            matched = {
+                uuid
+                for uuid in self.workspace.keys
+                if task_matches(self.store.get(uuid), terms)
+            }
+            self.set_selection(self.selected_uuids | matched)
+            self.notify(f"{len(matched)} matching, {len(self.selected_uuids)} selected")
+
+        self.push_screen(
+            PromptScreen("🎯 SELECT BY FILTER", "project:work +next priority:H"),
+            on_filter,
+        )
+
+    def action_toggle_visual(self):
+        if self.visual_anchor is not None:
+            # V again keeps the selection for the next action
+            self.visual_anchor = None
+            self.update_context_bar()
+            return
+        table = self.query_one(DataTable)
+        if table.row_count == 0:
+            return
+        self.visual_anchor = table.cursor_row
+        self.visual_base = set(self.selected_uuids)
+        self.extend_visual(table.cursor_row)
+
+    def extend_visual(self, row) -> None:
+        """Select the rows between the visual anchor and row, plus the earlier selection."""
+        low, high = sorted((self.visual_anchor, row))
+        keys = list(self.query_one(DataTable).rows)[low : high + 1]
+        covered = {k.value for k in keys if not k.value.startswith(GROUP_ROW)}
+        self.set_selection(self.visual_base | covered)
+
+    def cancel_visual(self) -> None:
+        self.visual_anchor = None
+        self.set_selection(self.visual_base)
+
+    def action_go_to_row(self):
+        """5g / 5G: jump to the fifth row."""
+        count, self.count = self.count, None
+        table = self.query_one(DataTable)
+        if table.row_count:
+            table.move_cursor(row=min(count, table.row_count) - 1)
+
+    def counted_rows(self, count):
+        """Task uuids in the count rows from the cursor down (group rows are skipped)."""
+        table = self.query_one(DataTable)
+        keys = list(table.rows)[table.cursor_row : table.cursor_row + count]
+        return [k.value for k in keys if not k.value.startswith(GROUP_ROW)]
+
+    def action_targets(self):
+        """The tasks an action applies to, and the end of visual mode.
+
+        A count prefix covers that many rows from the cursor; otherwise the
+        selection, or the task under the cursor when nothing is selected.
+        """
+        count, self.count = self.count, None
+        if count:
+            targets = self.counted_rows(count)
+        elif self.selected_uuids:
+            targets = list(self.selected_uuids)
+        else:
+            targets = [self.active_uuid]
+        if self.visual_anchor is not None:
+            self.visual_anchor = None
+            self.update_context_bar()
+        # A selection can outlive its task (completed by another client)
+        return [uid for uid in targets if uid and self.store.get(uid)]
+
+    def set_selection(self, uuids) -> None:
+        """Make uuids the selection, repainting only the rows whose marker changed."""
+        selected = self.selected_uuids
+        changed = selected ^ set(uuids)
+        selected.symmetric_difference_update(changed)
+        self.refresh_id_cells(changed)
+        self.update_context_bar()
+
+    def update_context_bar(self) -> None:
+        bar = self.query_one("#context_bar")
+        parts = []
+        if self.visual_anchor is not None:
+            parts.append(
+                f"-- VISUAL -- {len(self.selected_uuids)} selected | "
+                "[[j/k/g/G]] Extend | [[d/t/p]] Apply | [[V]] Keep | [[Esc]] Cancel"
+            )
+        if self.count_digits:
+            parts.append(f"Count: {self.count_digits}")
+        bar.update(" | ".join(parts))
+        bar.set_class(bool(parts), "visible")
 
     def action_date_mode(self):
         def check_result(result):
@@ -672,189 +3070,351 @@ class TaskProApp(App):
     #     self.query_one("#context_bar").remove_class("visible")
     #
     def apply_quick_date(self, date_str):
-        targets = (
-            list(self.selected_uuids) if self.selected_uuids else [self.active_uuid]
+        targets = self.action_targets()
+        due = tw_date(self.evaluate_due(date_str))
+        self.record_modify(
+            f"due:{date_str} on {len(targets)} task(s)", targets, {"due": due}
+        )
+        self.apply_local_edit(targets, {"due": due})
+        self.run_in_background(
+            [[*TASK_BULK, *targets, "modify", f"due:{due}"]] if targets else []
         )
-        for uid in targets:
-            if uid != "NEW":
-                subprocess.run(["task", uid, "modify", f"due:{date_str}"])
-        self.refresh_tasks()
         # self.exit_context_mode()
 
     def apply_quick_prio(self, level):
-        targets = (
-            list(self.selected_uuids) if self.selected_uuids else [self.active_uuid]
+        targets = self.action_targets()
+        self.record_modify(
+            f"priority:{level or 'none'} on {len(targets)} task(s)",
+            targets,
+            {"priority": level},
+        )
+        self.apply_local_edit(targets, {"priority": level})
+        self.run_in_background(
+            [[*TASK_BULK, *targets, "modify", f"priority:{level}"]] if targets else []
         )
-        for uid in targets:
-            if uid != "NEW":
-                subprocess.run(["task", uid, "modify", f"priority:{level}"])
-        self.refresh_tasks()
         # self.exit_context_mode()
 
     # --- DATA & TABLE ---
     def refresh_tasks(self) -> None:
-        table = self.query_one(DataTable)
-        saved_row_key = None
-        if table.row_count > 0:
-            try:
-                saved_row_key = table.get_row_at(table.cursor_row).key
-            except:
-                pass
+        self.reconcile(task_export("status:pending"))
+
+    def reconcile(self, tasks, errors=()) -> None:
+        """Replace local state with an export; exported values always win."""
+        saved_uuid = self.cursor_uuid()
+        try:
+            changes = self.store.load(tasks)
+            # An export that only confirms the screen repaints nothing, otherwise
+            # the changed rows and their dependency neighbours are patched
+            touched = set()
+            for old, new in changes:
+                for t in (old, new):
+                    if t:
+                        touched.add(t["uuid"])
+                        touched.update(parse_depends(t.get("depends")))
+            if touched:
+                self.refresh_rows(touched)
+            self.update_summary()
+            if saved_uuid:
+                self.move_cursor_to(saved_uuid)
+        except:
+            pass
+        if errors:
+            self.query_one("#debug_panel").update(f"❌ ERROR: {errors[-1]}")
+            self.notify(
+                "Taskwarrior rejected a change! Check Debug Log.", severity="error"
+            )
 
-        res = subprocess.run(
-            ["task", "status:pending", "export", "rc.json.array=on"],
-            capture_output=True,
-            text=True,
+    @work(thread=True, group="task")
+    def run_in_background(self, commands) -> None:
+        """Run task commands off the UI thread, then reconcile with one export."""
+        errors = []
+        # One command batch at a time so modifications land in order
+        with self.task_lock:
+            for cmd in commands:
+                res = task_run(cmd)
+                if res.returncode != 0:
+                    errors.append(res.stderr.strip() or res.stdout.strip())
+            tasks = task_export("status:pending")
+        self.call_from_thread(self.reconcile, tasks, errors)
+
+    @work(thread=True, group="task")
+    def run_and_patch(self, commands, uuids) -> None:
+        """Run task commands off the UI thread and re-export only the given tasks."""
+        errors = []
+        with self.task_lock:
+            for cmd in commands:
+                res = task_run(cmd)
+                if res.returncode != 0:
+                    errors.append(res.stderr.strip() or res.stdout.strip())
+            tasks = export_uuids(uuids)
+        self.call_from_thread(self.patch_rows, uuids, tasks, errors)
+
+    def patch_rows(self, uuids, tasks, errors=()) -> None:
+        """Apply a partial export: tasks missing or not pending leave the list."""
+        pending = {t["uuid"]: t for t in tasks if t.get("status") == "pending"}
+        self.store.update(uuids, pending)
+        self.refresh_rows(uuids)
+        self.update_summary()
+        if errors:
+            self.query_one("#debug_panel").update(f"❌ ERROR: {errors[-1]}")
+            self.notify(
+                "Taskwarrior rejected a change! Check Debug Log.", severity="error"
+            )
+
+    def refresh_rows(self, uuids) -> None:
+        """Redraw only the given rows; rebuild when their order or presence changes."""
+        table = self.query_one(DataTable)
+        visible = self.workspace.keys
+        if self.workspace.grouped:
+            # Group counts and max urgency follow any change, rebuild the
+            # expanded part and copy the rows that did not change
+            if any(uuid in visible or uuid in table.rows for uuid in uuids):
+                changed = set(uuids)
+                self.update_table_view(
+                    reuse=[u for u in self.task_rows_on_screen() if u not in changed]
+                )
+            return
+        for uuid in uuids:
+            if uuid not in self.row_sort_values:
+                if uuid not in visible:
+                    continue
+                # A task came (back) into view, only a full rebuild knows where it goes
+                return self.update_table_view()
+            if uuid not in visible:
+                table.remove_row(uuid)
+                del self.row_sort_values[uuid]
+                continue
+            if visible[uuid][0] != self.row_sort_values[uuid]:
+                return self.update_table_view()
+            for (_, key), cell in zip(
+                TASK_COLUMNS, self.format_task_row(self.store.get(uuid))
+            ):
+                table.update_cell(uuid, key, cell)
+
+    def apply_local_edit(self, uuids, fields) -> None:
+        """Patch tasks in the store and re-rank them before Taskwarrior answers."""
+        graph = self.store.graph
+        touched = set()
+        for uuid in uuids:
+            # Blocked/blocking neighbours before and after the edit get new urgency too
+            touched.update(graph.depends_on(uuid), graph.blocking(uuid))
+            if self.store.patch(uuid, fields):
+                touched.add(uuid)
+                touched.update(graph.depends_on(uuid), graph.blocking(uuid))
+        for uuid in touched:
+            task = self.store.get(uuid)
+            if task:
+                self.store.patch(uuid, {"urgency": self.urgency.compute(task, graph)})
+        # Rows outside the edit keep their cells, only the touched ones are re-formatted
+        self.update_table_view(
+            reuse=[u for u in self.task_rows_on_screen() if u not in touched]
         )
+        self.update_summary()
+        if self.active_uuid in touched:
+            self.move_cursor_to(self.active_uuid)
+
+    def cursor_uuid(self):
+        table = self.query_one(DataTable)
+        if table.row_count == 0:
+            return None
         try:
-            self.raw_tasks = json.loads(res.stdout)
-            self.update_table_view()
-            if saved_row_key:
-                for idx, row_key in enumerate(table.rows):
-                    if row_key == saved_row_key:
-                        table.move_cursor(row=idx)
-                        break
+            return table.coordinate_to_cell_key(table.cursor_coordinate).row_key.value
+        except:
+            return None
+
+    def move_cursor_to(self, uuid) -> None:
+        table = self.query_one(DataTable)
+        try:
+            table.move_cursor(row=table.get_row_index(uuid))
         except:
             pass
 
-    def update_table_view(self) -> None:
+    def update_table_view(self, reuse=()) -> None:
         table = self.query_one(DataTable)
         # --- SAVE CURSOR POSITION ---
         # We save the row index so we can jump back to it after the refresh
         saved_cursor_row = table.cursor_row
         saved_scroll_x, saved_scroll_y = table.scroll_offset
+        # Rows whose cells are known to be current are copied, not re-formatted
+        reused = {uuid: table.get_row(uuid) for uuid in reuse if uuid in table.rows}
 
-        table.clear(columns=True)
-        cols = [
-            ("ID", "id"),
-            ("Proj.", "project"),
-            ("P.", "priority"),
-            ("Due", "due"),
-            ("Tags", "tags"),
-            ("Urg.", "urgency"),
-            ("Desc.", "description"),
-        ]
+        markers = self.profile.markers
+        cols = TASK_COLUMNS
+        labels = []
         for i, (label, _) in enumerate(cols):
             icon = (
-                " 🔽"
+                markers["sort_desc"]
                 if i == self.sort_state["index"] and self.sort_state["reverse"]
-                else " 🔼"
-                if i == self.sort_state["index"]
-                else ""
+                else markers["sort_asc"] if i == self.sort_state["index"] else ""
             )
-            table.add_column(f"{label}{icon}", key=cols[i][1])
-
-        # --- PROJECT COLOR HASHING ---
-        def get_project_color(project_name):
-            if not project_name:
-                return "white"
-            # Standard ANSI/Xterm colors (avoiding very dark ones)
-            # This provides a palette of ~200 distinct colors
-            colors = [
-                "green",
-                "yellow",
-                "blue",
-                "magenta",
-                "cyan",
-                "white",
-                "bright_black",
-                "bright_red",
-                "bright_green",
-                "bright_yellow",
-                "bright_blue",
-                "bright_magenta",
-                "bright_cyan",
-                "bright_white",
-                "orange1",
-                "orange_red1",
-                "orchid",
-                "pale_green1",
-                "pale_turquoise1",
-                "hot_pink",
-                "indian_red",
-                "khaki1",
-                "light_coral",
-                "light_pink1",
-                "light_salmon1",
-                "light_sea_green",
-                "light_skyblue1",
-                "light_slate_blue",
-                "light_steel_blue1",
-                "medium_orchid1",
-                "medium_purple1",
-                "medium_spring_green",
-            ]
-            # Use a simple hash to pick a consistent color for the project name
-            idx = sum(ord(c) for c in project_name) % len(colors)
-            return colors[idx]
-
-        sort_key = cols[self.sort_state["index"]][1]
-
-        def sort_logic(t):
-            val = t.get(sort_key, "")
-            if sort_key == "urgency":
-                try:
-                    return float(val)
-                except:
-                    return 0.0
-            # Custom Priority Weighting
-            if sort_key == "priority":
-                # Assign numeric weights so H (3) > M (2) > L (1) > None (0)
-                weights = {"H": 3, "M": 2, "L": 1, "X": 0, "": 0}
-                return weights.get(val, 0)
-
-            return str(val).lower()
-
-        # Sort with reverse=True so higher weights (H) appear at the top
-        sorted_data = sorted(
-            self.raw_tasks,
-            key=sort_logic,
-            reverse=True if sort_key == "priority" else self.sort_state["reverse"],
+            labels.append(f"{label}{icon}")
+        # The header is only rebuilt (and repainted) when the sort arrow moved
+        if labels == self.column_labels:
+            table.clear()
+        else:
+            table.clear(columns=True)
+            for label, (_, key) in zip(labels, cols):
+                table.add_column(label, key=key)
+            self.column_labels = labels
+
+        # The workspace keeps its rows sorted, remember each row's sort value
+        # so single rows can be patched in place
+        ws = self.workspace
+        self.row_sort_values = {uuid: key[0] for uuid, key in ws.keys.items()}
+        if ws.grouped:
+            for key, cells in self.grouped_rows(reused):
+                table.add_row(*cells, key=key)
+        else:
+            for uuid in ws.uuids():
+                cells = reused.get(uuid) or self.format_task_row(self.store.get(uuid))
+                table.add_row(*cells, key=uuid)
+
+        # --- RESTORE CURSOR POSITION ---
+        if table.row_count > 0:
+            # Ensure the saved index isn't out of bounds if the list shrank
+            new_row = min(saved_cursor_row, table.row_count - 1)
+            table.move_cursor(row=new_row)
+            # Restore the scroll position so the view doesn't jump
+            table.scroll_to(x=saved_scroll_x, y=saved_scroll_y, animate=False)
+
+    def format_task_row(self, t):
+        """Render one task as the cells of a TASK_COLUMNS row."""
+        uuid = t.get("uuid")
+        prio = t.get("priority", "X")
+        prio_color = {"H": "red", "M": "yellow", "L": "green"}.get(prio, "white")
+
+        # Get the color for the project
+        proj_name = t.get("project", "")
+        proj_color = get_project_color(proj_name)
+        # 2. Urgency Color Logic
+        urgency_display = format_urgency(t.get("urgency", 0))
+        dep_icon = self.dependency_marker(uuid)
+
+        return (
+            self.format_id_cell(t),
+            f"[{proj_color}]{proj_name}[/]",  # Apply the project color here
+            f"[{prio_color}]{prio}[/]",
+            (t.get("due", "") or "")[:8],
+            ",".join(t.get("tags", [])),
+            urgency_display,  # Use the conditionally styled urgency here
+            f"{dep_icon}{t.get('description', '')}",
         )
-        # sorted_data = sorted(
-        #     self.raw_tasks, key=sort_logic, reverse=self.sort_state["reverse"]
-        # )
 
-        for t in sorted_data:
-            uuid = t.get("uuid")
-            prio = t.get("priority", "X")
-            prio_color = {"H": "red", "M": "yellow", "L": "green"}.get(prio, "white")
-
-            # Get the color for the project
-            proj_name = t.get("project", "")
-            proj_color = get_project_color(proj_name)
-            # 2. Urgency Color Logic
-            urgency_val = t.get("urgency", 0)
-            # If urgency is above 20, wrap it in a red bold tag
-            urgency_str = f"{urgency_val:.1f}"
-            if urgency_val > 20:
-                urgency_display = f"[b][red]{urgency_str}[/][/]"
-            else:
-                urgency_display = urgency_str
+    def format_id_cell(self, t):
+        """The first cell of a task row: the selection or status marker, then the id."""
+        uuid = t.get("uuid")
+        markers = self.profile.markers
+        status = t.get("status", "pending")
+        if status == "completed":
+            is_active = markers["completed"]
+        elif status == "deleted":
+            is_active = markers["deleted"]
+        else:
+            is_active = markers["started"] if t.get("start") else "  "
+        prefix = markers["selected"] if uuid in self.selected_uuids else is_active
+        # Completed/deleted tasks have id 0, show the short uuid instead
+        ident = t.get("id") or (uuid or "")[:8]
+        return f"{prefix}{ident}"
+
+    def refresh_id_cells(self, uuids) -> None:
+        """Repaint only the ID cell of the given rows; rows not shown are skipped."""
+        table = self.query_one(DataTable)
+        for uuid in uuids:
+            task = self.store.get(uuid)
+            if task and uuid in table.rows:
+                table.update_cell(uuid, "id", self.format_id_cell(task))
+
+    def grouped_rows(self, reused):
+        """(key, cells) of the grouped view; collapsed groups yield only their header."""
+        ws = self.workspace
+        root = group_by_project(self.store.get(uuid) for uuid in ws.uuids())
+
+        def walk(group, depth):
+            # Tasks without a project are listed last
+            for name, child in sorted(
+                group.children.items(), key=lambda item: (item[0] == "", item[0])
+            ):
+                expanded = child.path in ws.expanded
+                yield GROUP_ROW + child.path, self.format_group_row(
+                    child, name, depth, expanded
+                )
+                if not expanded:
+                    continue
+                yield from walk(child, depth + 1)
+                for uuid in child.uuids:
+                    cells = reused.get(uuid) or self.format_task_row(
+                        self.store.get(uuid)
+                    )
+                    yield uuid, cells
+
+        return walk(root, 0)
+
+    def format_group_row(self, group, name, depth, expanded):
+        """Render a project group as a TASK_COLUMNS row."""
+        label = name or "(no project)"
+        color = get_project_color(group.path)
+        return (
+            self.profile.markers["expanded" if expanded else "collapsed"],
+            f"{'  ' * depth}[b][{color}]{label}[/][/]",
+            "",
+            "",
+            "",
+            format_urgency(group.max_urgency),
+            f"[dim]{group.count} task{'' if group.count == 1 else 's'}[/]",
+        )
 
-            is_active = "▸ " if t.get("start") else "  "
-            prefix = "⭐ " if uuid in self.selected_uuids else is_active
-            dep_icon = "🔗 " if "depends" in t and t["depends"] else ""
+    def task_rows_on_screen(self):
+        table = self.query_one(DataTable)
+        return [key.value for key in table.rows if not key.value.startswith(GROUP_ROW)]
 
-            table.add_row(
-                f"{prefix}{t.get('id')}",
-                f"[{proj_color}]{proj_name}[/]",  # Apply the project color here
-                # t.get("project", ""),
-                f"[{prio_color}]{prio}[/]",
-                (t.get("due", "") or "")[:8],
-                ",".join(t.get("tags", [])),
-                # f"{t.get('urgency', 0):.1f}",
-                urgency_display,  # Use the conditionally styled urgency here
-                f"{dep_icon}{t.get('description', '')}",
-                key=uuid,
-            )
-            # --- RESTORE CURSOR POSITION ---
-            if table.row_count > 0:
-                # Ensure the saved index isn't out of bounds if the list shrank
-                new_row = min(saved_cursor_row, table.row_count - 1)
-                table.move_cursor(row=new_row)
-                # Restore the scroll position so the view doesn't jump
-                table.scroll_to(x=saved_scroll_x, y=saved_scroll_y, animate=False)
+    def toggle_group(self, path) -> None:
+        ws = self.workspace
+        if path in ws.expanded:
+            ws.expanded.discard(path)
+        else:
+            ws.expanded.add(path)
+        # Only the children that just came into view get formatted
+        self.update_table_view(reuse=self.task_rows_on_screen())
+        self.move_cursor_to(GROUP_ROW + path)
+
+    def action_toggle_grouped(self):
+        ws = self.workspace
+        uuid = self.cursor_uuid()
+        ws.grouped = not ws.grouped
+        task = self.store.get(uuid) if uuid else None
+        if ws.grouped and task:
+            # Open the groups above the current task so the cursor can stay on it
+            parts = task.get("project", "").split(".")
+            ws.expanded.update(".".join(parts[: i + 1]) for i in range(len(parts)))
+        self.update_table_view()
+        if uuid:
+            self.move_cursor_to(uuid)
+
+    def action_toggle_all_groups(self):
+        ws = self.workspace
+        if not ws.grouped:
+            return
+        if ws.expanded:
+            ws.expanded.clear()
+        else:
+            stack = [group_by_project(self.store.get(u) for u in ws.uuids())]
+            while stack:
+                group = stack.pop()
+                for child in group.children.values():
+                    ws.expanded.add(child.path)
+                    stack.append(child)
+        self.update_table_view(reuse=self.task_rows_on_screen())
+
+    def dependency_marker(self, uuid):
+        graph = self.store.graph
+        blocked, blocking = graph.is_blocked(uuid), graph.is_blocking(uuid)
+        if blocked and blocking:
+            return self.profile.markers["both"]
+        if blocked:
+            return self.profile.markers["blocked"]
+        if blocking:
+            return self.profile.markers["blocking"]
+        return ""
 
     def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
         if self.sort_state["index"] == event.column_index:
@@ -862,8 +3422,69 @@ class TaskProApp(App):
         else:
             self.sort_state["index"] = event.column_index
             self.sort_state["reverse"] = False
+        self.workspace.rebuild(self.store.tasks())
         self.update_table_view()
 
+    # --- WORKSPACES ---
+    def switch_workspace(self, index) -> None:
+        if self.is_dirty:
+            self.notify(
+                "⚠️ Save (x) or Discard (Ctrl+Z) before switching views!",
+                severity="error",
+            )
+            return
+        self.workspace.cursor_uuid = self.cursor_uuid()
+        # The visual range belongs to the rows of the view being left
+        self.visual_anchor = None
+        self.update_context_bar()
+        self.workspace_index = index % len(self.workspaces)
+        self.query_one("#workspace_tabs").active = self.workspace.tab_id
+        self.update_table_view()
+        if self.workspace.cursor_uuid:
+            self.move_cursor_to(self.workspace.cursor_uuid)
+        self.query_one(DataTable).focus()
+
+    def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
+        for idx, ws in enumerate(self.workspaces):
+            if ws.tab_id == event.tab.id and idx != self.workspace_index:
+                self.switch_workspace(idx)
+                break
+
+    def action_next_workspace(self):
+        self.switch_workspace(self.workspace_index + 1)
+
+    def action_prev_workspace(self):
+        self.switch_workspace(self.workspace_index - 1)
+
+    def action_new_workspace(self):
+        def on_filter(text):
+            if text is None:
+                return
+            self.workspace_counter += 1
+            ws = Workspace(text.strip() or "All", text, dict(self.sort_state))
+            ws.tab_id = f"ws-{self.workspace_counter}"
+            ws.rebuild(self.store.tasks())
+            self.store.listeners.append(ws)
+            self.workspaces.append(ws)
+            self.query_one("#workspace_tabs").add_tab(Tab(ws.name, id=ws.tab_id))
+            self.switch_workspace(len(self.workspaces) - 1)
+
+        self.push_screen(
+            PromptScreen(
+                "🗂 NEW VIEW (filter)", "e.g. project:work +next -someday or words..."
+            ),
+            on_filter,
+        )
+
+    def action_close_workspace(self):
+        if len(self.workspaces) == 1:
+            return
+        ws = self.workspaces.pop(self.workspace_index)
+        self.store.listeners.remove(ws)
+        self.query_one("#workspace_tabs").remove_tab(ws.tab_id)
+        self.workspace_index = min(self.workspace_index, len(self.workspaces) - 1)
+        self.switch_workspace(self.workspace_index)
+
     #
     # def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
     #     if not self.is_modifying and event.row_key:
@@ -871,6 +3492,9 @@ class TaskProApp(App):
     #
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Called when Enter is pressed on a row."""
+        if event.row_key and event.row_key.value.startswith(GROUP_ROW):
+            self.toggle_group(event.row_key.value[len(GROUP_ROW) :])
+            return
         if self.is_dirty:
             self.notify(
                 "⚠️ Save (x) or Discard (Ctrl+Z) before switching tasks!",
@@ -887,22 +3511,46 @@ class TaskProApp(App):
         if self.is_dirty:
             return
 
+        if self.visual_anchor is not None:
+            self.extend_visual(event.cursor_row)
         if not self.is_modifying and event.row_key:
-            self.load_task_by_uuid(event.row_key.value, focus=False)
+            if event.row_key.value.startswith(GROUP_ROW):
+                # Task actions have nothing to act on from a group row
+                self.active_uuid = None
+                return
+            if not self.profile.editor_delay:
+                self.load_task_by_uuid(event.row_key.value, focus=False)
+                return
+            # Actions follow the cursor at once, the editor panel (most of the
+            # bytes of a cursor move) only once the cursor rests
+            uuid = self.active_uuid = event.row_key.value
+            if self.editor_timer:
+                self.editor_timer.stop()
+            # Owned by the table's screen, so it stops when that screen goes away
+            self.editor_timer = event.data_table.screen.set_timer(
+                self.profile.editor_delay, lambda: self.show_resting_task(uuid)
+            )
+
+    def show_resting_task(self, uuid) -> None:
+        # Nothing to show into once the app is shutting down
+        if not self.is_running or not self.query("#uuid_display"):
+            return
+        if not self.is_modifying and not self.is_dirty and self.active_uuid == uuid:
+            self.load_task_by_uuid(uuid, focus=False)
 
     def load_task_by_uuid(self, uuid: str, focus: bool = True):
-        task = next((t for t in self.raw_tasks if t["uuid"] == uuid), None)
+        task = self.store.get(uuid)
         if not task:
             return
         self.active_uuid = uuid
+        self.loaded_task = dict(task)
         self.query_one("#uuid_display").update(uuid)
         self.query_one("#inp_desc").value = task.get("description", "")
         self.query_one("#inp_proj").value = task.get("project", "")
-        # Clean the date to YYYYMMDD format for the input field
-        due_date = (task.get("due", "") or "").replace("Z", "")[:8]
-        self.query_one("#inp_due").value = due_date
+        # Show the due date in local time, as YYYYMMDD when it is a plain day
+        self.query_one("#inp_due").value = format_due_input(task.get("due"))
         self.query_one("#inp_tags").value = ",".join(task.get("tags", []))
-        self.query_one("#inp_dep").value = ", ".join(map(str, task.get("depends", [])))
+        self.query_one("#inp_dep").value = ", ".join(parse_depends(task.get("depends")))
         self.query_one("#sel_prio").value = task.get("priority", "X")
         if focus:
             self.set_modify_mode(True)
@@ -922,7 +3570,7 @@ class TaskProApp(App):
         if active:
             panel.remove_class("view_mode")
             panel.add_class("edit_mode")
-            indicator.update("✏️ MODIFYING")
+            indicator.update(self.profile.markers["modifying"])
             for node in inputs:
                 node.disabled = False  # Ensure they are interactable
                 if hasattr(node, "read_only"):
@@ -930,7 +3578,9 @@ class TaskProApp(App):
         else:
             panel.remove_class("edit_mode")
             panel.add_class("view_mode")
-            indicator.update("🔒 VIEWING")
+            indicator.update(self.profile.markers["viewing"])
+            self.query_one("#dep_hint").update("")
+            self.query_one("#due_preview").update("")
             for node in inputs:
                 node.disabled = True
                 # # Setting read_only keeps them readable but prevents typing
@@ -946,7 +3596,7 @@ class TaskProApp(App):
                 self.query_one(DataTable).focus()
                 # --- CRITICAL FIX END ---
         if not active:
-            self.query_one("#mode_indicator").update("🔒 VIEWING")
+            self.query_one("#mode_indicator").update(self.profile.markers["viewing"])
             self.query_one(DataTable).focus()
 
     #
@@ -977,28 +3627,71 @@ class TaskProApp(App):
         dep_raw = self.query_one("#inp_dep").value.strip()
         dep_val = ",".join([d.strip() for d in dep_raw.split(",") if d.strip()])
 
+        # Refuse dependency loops before Taskwarrior ever sees them
+        if self.active_uuid != "NEW" and dep_val:
+            dep_uuids = [self.store.resolve(d) or d for d in dep_val.split(",")]
+            cycle = self.store.graph.find_cycle(self.active_uuid, dep_uuids)
+            if cycle:
+                chain = " → ".join(
+                    str((self.store.get(u) or {}).get("id", u[:8])) for u in cycle
+                )
+                self.query_one("#debug_panel").update(
+                    f"❌ ERROR: dependency cycle {chain}"
+                )
+                self.notify("Save Failed! Dependency cycle.", severity="error")
+                return
+
+        # Only the fields that differ from what was loaded are sent
+        loaded = editable_values(self.loaded_task)
+        changes = {
+            key: value
+            for key, value in self.editor_fields().items()
+            if value != loaded[key]
+        }
+        if not changes:
+            self.set_modify_mode(False)
+            self.query_one(DataTable).focus()
+            self.notify("Nothing changed.")
+            return
+        if self.active_uuid == "NEW":
+            return self.save_changes(changes)
+
+        # A change made elsewhere since loading would be silently overwritten
+        uuid = self.active_uuid
+        current = task_export(uuid)
+        if not current:
+            self.query_one("#debug_panel").update(f"❌ ERROR: {uuid} no longer exists")
+            self.notify("Save Failed! Task was removed.", severity="error")
+            return
+        if current[0].get("modified") == self.loaded_task.get(
+            "modified"
+        ) or editable_values(current[0]) == editable_values(self.loaded_task):
+            return self.save_changes(changes)
+
+        def on_merge(choice):
+            if choice is None:
+                return
+            self.patch_rows([uuid], current)
+            if choice == "mine":
+                self.loaded_task = dict(current[0])
+                self.save_changes(changes)
+            else:
+                self.load_task_by_uuid(uuid, focus=False)
+                self.query_one(DataTable).focus()
+                self.notify("Loaded the other changes, your edit was dropped.")
+
+        self.push_screen(MergeScreen(self.loaded_task, current[0], changes), on_merge)
+
+    def save_changes(self, changes):
+        """Send the changed fields as one `task add`/`task modify`."""
         target = "add" if self.active_uuid == "NEW" else self.active_uuid
         cmd = ["task", target]
         if self.active_uuid != "NEW":
             cmd.append("modify")
-        # Fix the date format before sending to Taskwarrior
-        due_val = self.query_one("#inp_due").value.strip()
-        if due_val.isdigit() and len(due_val) == 8:
-            due_val += "T000000"  # Convert YYYYMMDD to YYYYMMDDT000000
-
-        cmd.extend(
-            [
-                f"description:{self.query_one('#inp_desc').value}",
-                f"project:{self.query_one('#inp_proj').value}",
-                f"due:{due_val}",  # Use the corrected date value here
-                f"tags:{self.query_one('#inp_tags').value}",
-                f"depends:{dep_val}",
-                f"priority:{self.query_one('#sel_prio').value if self.query_one('#sel_prio').value != 'X' else ''}",
-            ]
-        )
+        cmd.extend(field_args(changes))
 
         # IMPROVED EXECUTION: Capture errors for the debug log
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = task_run(cmd)
 
         if result.returncode != 0:
             # If Taskwarrior complains, we finally see why in the debug panel
@@ -1007,11 +3700,67 @@ class TaskProApp(App):
             self.notify("Save Failed! Check Debug Log.", severity="error")
         else:
             self.query_one("#debug_panel").update(f"✅ Saved successfully: {target}")
+            if self.active_uuid != "NEW":
+                self.record_modify(
+                    f"edit of task {self.store.get(self.active_uuid).get('id')}",
+                    [self.active_uuid],
+                    changes,
+                )
+                # A due date only Taskwarrior could read waits for the refresh
+                local = {
+                    key: value
+                    for key, value in changes.items()
+                    if key != "due" or not value or parse_tw_date(value)
+                }
+                self.apply_local_edit([self.active_uuid], local)
+            else:
+                latest = task_run(["task", "+LATEST", "_uuids"]).stdout.split()
+                if latest:
+                    self.undo_log.record(
+                        Operation(
+                            f"add of '{changes.get('description', '')}'",
+                            "add",
+                            {latest[0]: {}},
+                        )
+                    )
             self.set_modify_mode(False)
-            self.refresh_tasks()
+            # The export after a save only confirms what is already on screen
+            self.run_in_background([])
             self.query_one(DataTable).focus()
             self.notify("Saved!")
 
+    def editor_fields(self):
+        """The editor values in export form, for patching the local task."""
+        dep_raw = self.query_one("#inp_dep").value
+        prio = self.query_one("#sel_prio").value
+        fields = {
+            "description": self.query_one("#inp_desc").value,
+            "project": self.query_one("#inp_proj").value,
+            "tags": [
+                t.strip()
+                for t in self.query_one("#inp_tags").value.split(",")
+                if t.strip()
+            ],
+            "depends": [
+                self.store.resolve(d) or d.strip()
+                for d in dep_raw.split(",")
+                if d.strip()
+            ],
+            "priority": prio if prio != "X" else None,
+        }
+        due_val = self.query_one("#inp_due").value.strip()
+        loaded_due = self.loaded_task.get("due")
+        if loaded_due and due_val == format_due_input(loaded_due):
+            # Untouched: keep the stamp rather than a re-evaluation of its text
+            fields["due"] = loaded_due
+            return fields
+        try:
+            fields["due"] = tw_date(self.evaluate_due(due_val)) if due_val else None
+        except ValueError:
+            # A format only Taskwarrior knows (rc.dateformat): send the text as typed
+            fields["due"] = due_val
+        return fields
+
     #
     # def action_save_task(self):
     #     if not self.active_uuid:
@@ -1048,7 +3797,71 @@ class TaskProApp(App):
 
 
 def run():
-    TaskProApp().run()
+    parser = argparse.ArgumentParser(prog="task-tui", description=__doc__)
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep the task store warm and serve it over a Unix socket",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="talk to task directly even if a daemon is running",
+    )
+    parser.add_argument(
+        "--counts",
+        action="store_true",
+        help="print pending task counts as JSON and exit (for shell prompts)",
+    )
+    parser.add_argument(
+        "--low-bandwidth",
+        action="store_true",
+        help="ASCII markers, 10 fps, no animation or blink "
+        "(also TASK_TUI_PROFILE=low)",
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="trace allocations, M then shows memory per subsystem (slow)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="FILE",
+        help="save the keys pressed in this session as a replay script",
+    )
+    args = parser.parse_args()
+
+    from task_tui.daemon import DaemonBackend, serve, task_counts
+
+    if args.daemon:
+        serve()
+        return
+    if not args.no_daemon:
+        client = DaemonBackend.connect()
+        if client:
+            set_backend(client)
+    if args.counts:
+        if hasattr(backend, "request"):
+            counts = backend.request({"op": "counts"})
+        else:
+            store = TaskStore()
+            store.load(task_export("status:pending"))
+            counts = task_counts(store)
+        print(json.dumps(counts))
+        return
+    low = args.low_bandwidth or os.environ.get("TASK_TUI_PROFILE") == "low"
+    profile = PROFILES["low" if low else "full"]
+    if args.memory_report:
+        from task_tui.memcheck import FRAMES
+
+        tracemalloc.start(FRAMES)
+    if args.record:
+        from task_tui.replay import record
+
+        record(args.record, profile)
+        return
+    with frame_pacing(profile.max_fps):
+        TaskProApp(profile).run()
 
 
 if __name__ == "__main__":
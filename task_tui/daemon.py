@@ -0,0 +1,318 @@
+import asyncio
+import json
+import os
+import signal
+import socket
+import sqlite3
+import subprocess
+
+from task_tui.app import (
+    DirectBackend,
+    SearchIndex,
+    TaskStore,
+    load_task_config,
+    parse_filter,
+    task_matches,
+)
+
+PENDING_EXPORT = ["task", "status:pending", "export", "rc.json.array=on"]
+
+# Commands that never change the data, so the store does not need a reload
+READ_ONLY = {
+    "export",
+    "_show",
+    "_uuids",
+    "_ids",
+    "_projects",
+    "_tags",
+    "count",
+    "show",
+    "calc",
+    "_get",
+}
+# Commands that do change it; any other first command word also reloads
+MUTATIONS = {
+    "add",
+    "log",
+    "modify",
+    "append",
+    "prepend",
+    "annotate",
+    "denotate",
+    "done",
+    "delete",
+    "start",
+    "stop",
+    "duplicate",
+    "import",
+    "purge",
+    "undo",
+    "sync",
+    "edit",
+    "config",
+    "context",
+}
+
+
+def command_word(cmd):
+    """The command of a task command line: its first word naming one.
+
+    Filter words come before the command and arguments after it, so a bare
+    `count` in a description does not make `task add` read-only.
+    """
+    return next((w for w in cmd[1:] if w in READ_ONLY or w in MUTATIONS), None)
+
+
+def socket_path():
+    """Where the daemon listens (override with TASK_TUI_SOCKET)."""
+    if os.environ.get("TASK_TUI_SOCKET"):
+        return os.environ["TASK_TUI_SOCKET"]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(runtime_dir, f"task-tui-{os.getuid()}.sock")
+
+
+def task_counts(store):
+    """The store's summary counters plus the number of blocked tasks."""
+    counts = store.summary.snapshot()
+    counts["blocked"] = store.graph.blocked_count()
+    return counts
+
+
+# --- SERVER ---
+class TaskDaemon:
+    """Keeps the pending tasks exported, indexed and watched for other processes.
+
+    Clients send one JSON request per connection and get one JSON line back:
+
+    - {"op": "run", "args": [...], "input": ...}: run a task command; the
+      plain pending export is answered from memory, mutations reload the store
+    - {"op": "list", "filter": "project:work +next"}: matching pending tasks
+    - {"op": "search", "query": "words"}: the best matches of any status from
+      the SearchIndex, which is kept caught up with every reload
+    - {"op": "counts"}: the task_counts summary
+    - {"op": "watch", "since": n}: wait until the data generation passes n
+    """
+
+    def __init__(self, path=None, poll_interval=1.0, search_path=None):
+        self.path = path or socket_path()
+        self.poll_interval = poll_interval
+        self.direct = DirectBackend()
+        self.store = TaskStore()
+        # Shared with the TUIs, whose own syncs then have little left to do
+        self.search_index = SearchIndex(search_path)
+        self.pending_json = "[]"
+        self.generation = 0
+        self.changed = None
+        self.reload_lock = None
+
+    def reload(self):
+        """Re-export pending tasks; returns True if anything changed."""
+        res = self.direct.run(PENDING_EXPORT)
+        try:
+            tasks = json.loads(res.stdout)
+        except ValueError:
+            return False
+        if not self.store.load(tasks) and self.generation:
+            return False
+        self.pending_json = res.stdout
+        return True
+
+    def sync_search(self):
+        try:
+            self.search_index.sync()
+        except sqlite3.Error as e:
+            print(f"search index not updated: {e}")
+
+    async def refresh(self):
+        async with self.reload_lock:
+            changed = await asyncio.to_thread(self.reload)
+            # Completed and deleted tasks are indexed too, so sync either way
+            await asyncio.to_thread(self.sync_search)
+            if changed:
+                async with self.changed:
+                    self.generation += 1
+                    self.changed.notify_all()
+
+    def search(self, query):
+        """Index matches, as full tasks where they are pending."""
+        if self.search_index.ready and query.strip():
+            try:
+                rows = self.search_index.query(query)
+            except sqlite3.Error:
+                pass
+            else:
+                fields = ("uuid", "status", "id", "description", "project")
+                return [
+                    self.store.get(row[0]) or dict(zip(fields, row)) for row in rows
+                ]
+        # Until the first sync (or with no words), the pending tasks in memory
+        words = query.casefold().split()
+        found = []
+        for t in self.store.by_uuid.values():
+            text = " ".join(
+                [t.get("description", ""), t.get("project", "")]
+                + [a.get("description", "") for a in t.get("annotations", [])]
+            ).casefold()
+            if all(w in text for w in words):
+                found.append(t)
+        return found
+
+    def data_stamp(self):
+        location = os.path.expanduser(
+            load_task_config().get("data.location", "~/.task")
+        )
+        try:
+            with os.scandir(location) as entries:
+                return max(
+                    (e.stat().st_mtime_ns for e in entries if e.is_file()), default=0
+                )
+        except OSError:
+            return 0
+
+    async def watch_files(self):
+        stamp = self.data_stamp()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            new_stamp = await asyncio.to_thread(self.data_stamp)
+            if new_stamp != stamp:
+                stamp = new_stamp
+                await self.refresh()
+
+    async def dispatch(self, req):
+        op = req.get("op")
+        if op == "ping":
+            return {"generation": self.generation}
+        if op == "run":
+            cmd = req.get("args", [])
+            # A task client, not a way to run arbitrary programs as the user
+            if not cmd or cmd[0] != "task":
+                return {"error": "only task commands can be run"}
+            if cmd == PENDING_EXPORT:
+                return {"returncode": 0, "stdout": self.pending_json, "stderr": ""}
+            res = await asyncio.to_thread(self.direct.run, cmd, req.get("input"))
+            if command_word(cmd) not in READ_ONLY:
+                await self.refresh()
+            return {
+                "returncode": res.returncode,
+                "stdout": res.stdout,
+                "stderr": res.stderr,
+            }
+        if op == "list":
+            terms = parse_filter(req.get("filter", ""))
+            return {
+                "tasks": [
+                    t for t in self.store.by_uuid.values() if task_matches(t, terms)
+                ]
+            }
+        if op == "search":
+            return {"tasks": self.search(req.get("query", ""))}
+        if op == "counts":
+            return task_counts(self.store)
+        if op == "watch":
+            since = req.get("since", 0)
+            async with self.changed:
+                try:
+                    await asyncio.wait_for(
+                        self.changed.wait_for(lambda: self.generation > since),
+                        req.get("timeout", 30),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            return {"generation": self.generation}
+        return {"error": f"unknown op {op!r}"}
+
+    async def handle(self, reader, writer):
+        try:
+            line = await reader.readline()
+            try:
+                resp = await self.dispatch(json.loads(line))
+            except ValueError as e:
+                resp = {"error": str(e)}
+            writer.write(json.dumps(resp).encode() + b"\n")
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        self.changed = asyncio.Condition()
+        self.reload_lock = asyncio.Lock()
+        await self.refresh()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(
+            self.handle, path=self.path, limit=2**26
+        )
+        os.chmod(self.path, 0o600)
+        # Shut down cleanly (and remove the socket) on a plain `kill`
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGTERM, asyncio.current_task().cancel
+        )
+        print(
+            f"task-tui daemon listening on {self.path} ({len(self.store.by_uuid)} tasks)"
+        )
+        try:
+            async with server:
+                await asyncio.gather(server.serve_forever(), self.watch_files())
+        finally:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+def serve():
+    try:
+        asyncio.run(TaskDaemon().serve())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+# --- CLIENT ---
+class DaemonBackend:
+    """Same interface as DirectBackend, answered by a running daemon."""
+
+    def __init__(self, path):
+        self.path = path
+        self.direct = DirectBackend()
+
+    @classmethod
+    def connect(cls, path=None):
+        """A client for the daemon at path, or None if none of ours answers there."""
+        client = cls(path or socket_path())
+        try:
+            # In a shared directory like /tmp the socket could be someone else's
+            if os.stat(client.path).st_uid != os.getuid():
+                return None
+            client.request({"op": "ping"}, timeout=1)
+        except (OSError, ValueError):
+            return None
+        return client
+
+    def request(self, payload, timeout=None):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(self.path)
+            sock.sendall(json.dumps(payload).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                return json.loads(f.readline())
+
+    async def watch(self, since, timeout=30):
+        """Wait (without blocking a thread) for the data generation to pass since."""
+        reader, writer = await asyncio.open_unix_connection(self.path, limit=2**26)
+        try:
+            payload = {"op": "watch", "since": since, "timeout": timeout}
+            writer.write(json.dumps(payload).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())["generation"]
+        finally:
+            writer.close()
+
+    def run(self, cmd, input=None):
+        try:
+            resp = self.request({"op": "run", "args": cmd, "input": input})
+        except (OSError, ValueError):
+            # The daemon went away, keep working without it
+            return self.direct.run(cmd, input)
+        if "error" in resp:
+            return subprocess.CompletedProcess(cmd, 1, "", resp["error"])
+        return subprocess.CompletedProcess(
+            cmd, resp["returncode"], resp["stdout"], resp["stderr"]
+        )
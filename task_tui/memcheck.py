@@ -0,0 +1,317 @@
+"""Break TaskProApp's memory down by subsystem and check it against budgets.
+
+A headless app loads synthetic tasks, opens the search screen and closes it
+again while tracemalloc records every allocation. Each live block is charged
+to the subsystem whose code made it (store, views, table, render cache or
+search index). SQLite keeps the search index outside the Python heap, so
+its database file is measured on disk instead. Growth is reported per 10k
+pending tasks from the
+difference between a quarter-size run and a full-size one, so fixed costs
+(the widgets, the 50 search results) cancel out.
+
+Tracing every allocation slows the app down a lot: expect a few minutes for
+the default 2000 tasks.
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+from textual.widgets import DataTable
+
+from task_tui import app as task_app
+from task_tui.app import (
+    PROFILES,
+    SearchIndex,
+    TaskProApp,
+    frame_pacing,
+    set_backend,
+)
+from task_tui.replay import SyntheticBackend
+
+# Frames kept per allocation, enough to get from Rich/Textual back to our code
+FRAMES = 15
+
+MB = 1024 * 1024
+
+# Allowed growth per 10k pending tasks (plus 5k completed ones in the index)
+BUDGETS_PER_10K = {
+    "peak": 64 * MB,
+    "steady": 64 * MB,
+    "store": 48 * MB,
+    "views": 4 * MB,
+    "table": 24 * MB,
+    "render cache": 8 * MB,
+    "search db": 8 * MB,
+}
+
+# These hold per-task data. If one shrinks as tasks are added, fixed costs
+# (lazy imports, caches filled on first use) landed in one run only, and the
+# growth is noise rather than a measurement
+MUST_GROW = ("peak", "steady", "store", "table", "search db")
+
+SUBSYSTEMS = ("store", "views", "table", "render cache", "search index", "other")
+
+
+def subsystem_code():
+    """(subsystem, class or function) pairs the allocations are charged to."""
+    tui = TaskProApp
+    code = [
+        ("store", task_app.TaskStore),
+        ("store", task_app.DependencyGraph),
+        ("store", task_app.UrgencyModel),
+        ("store", task_app.CompletionIndex),
+        ("store", task_app.PrefixTrie),
+        ("store", task_app.SortedPrefixIndex),
+        ("store", task_app.SummaryCounters),
+        ("store", tui.refresh_tasks),
+        ("store", tui.reconcile),
+        ("store", tui.run_in_background),
+        ("store", tui.run_and_patch),
+        ("store", tui.patch_rows),
+        ("store", tui.apply_local_edit),
+        ("views", task_app.Workspace),
+        ("table", DataTable),
+        ("table", task_app.ProjectGroup),
+        ("table", task_app.group_by_project),
+        ("table", tui.update_table_view),
+        ("table", tui.refresh_rows),
+        ("table", tui.format_task_row),
+        ("table", tui.grouped_rows),
+        ("table", tui.format_group_row),
+        ("search index", task_app.SearchIndex),
+        ("search index", task_app.FuzzySearchScreen),
+    ]
+    # The table's rendering caches live inside DataTable itself
+    for name, member in vars(DataTable).items():
+        if "render" in name or name in ("_y_offsets", "ordered_rows"):
+            code.append(("render cache", member))
+    return code
+
+
+class Attribution:
+    """Charges tracebacks to subsystems by the source lines of their frames.
+
+    The innermost frame that falls inside one of the subsystems' code decides,
+    and where code is nested (a DataTable render method inside DataTable) the
+    narrowest match wins. Frames in Rich, Textual or the json module are
+    skipped, so what they allocate goes to the caller that asked for it.
+    Modules imported on first use are code, not data, and count as other.
+    """
+
+    def __init__(self):
+        self.ranges = {}  # filename -> [(first line, last line, subsystem)]
+        self.frames = {}  # (filename, lineno) -> subsystem or None
+        for subsystem, obj in subsystem_code():
+            obj = inspect.unwrap(getattr(obj, "fget", obj))
+            lines, first = inspect.getsourcelines(obj)
+            filename = inspect.getsourcefile(obj)
+            self.ranges.setdefault(filename, []).append(
+                (first, first + len(lines) - 1, subsystem)
+            )
+
+    def frame(self, filename, lineno):
+        key = (filename, lineno)
+        if key not in self.frames:
+            found = [
+                (last - first, subsystem)
+                for first, last, subsystem in self.ranges.get(filename, ())
+                if first <= lineno <= last
+            ]
+            self.frames[key] = min(found)[1] if found else None
+        return self.frames[key]
+
+    def subsystem(self, traceback):
+        # Tracebacks run from the oldest frame to the most recent one
+        for frame in reversed(traceback):
+            if frame.filename.startswith("<frozen importlib"):
+                return "other"
+            subsystem = self.frame(frame.filename, frame.lineno)
+            if subsystem:
+                return subsystem
+        return "other"
+
+    def breakdown(self, snapshot):
+        """Live bytes per subsystem in a tracemalloc snapshot."""
+        sizes = dict.fromkeys(SUBSYSTEMS, 0)
+        charged = {}  # most blocks share their traceback with many others
+        for trace in snapshot.traces:
+            traceback = trace.traceback
+            if traceback not in charged:
+                charged[traceback] = self.subsystem(traceback)
+            sizes[charged[traceback]] += trace.size
+        return sizes
+
+
+def disk_size(db_path):
+    """Bytes an SQLite database takes on disk, write-ahead log included."""
+    return sum(
+        os.path.getsize(path)
+        for path in (db_path, db_path + "-wal")
+        if os.path.exists(path)
+    )
+
+
+def take_snapshot():
+    if not tracemalloc.is_tracing():
+        return None
+    gc.collect()
+    return tracemalloc.take_snapshot()
+
+
+class MemoryApp(TaskProApp):
+    def on_unmount(self, event) -> None:
+        # No screen clearing or `task sync` at the end of a measurement
+        event.prevent_default()
+
+
+async def measure(tasks, profile=None, size=(160, 50), trace=True):
+    """Peak, steady and per-subsystem bytes of an app holding `tasks` pending tasks.
+
+    Subsystems are measured with the search screen open so every one of them
+    is live at once; steady is the total once it has been closed again, and
+    search db is the size of the search index's database file. With
+    trace=False the same session runs untraced and None is returned.
+    """
+    set_backend(SyntheticBackend(pending=tasks, completed=tasks // 2))
+    with tempfile.TemporaryDirectory() as tmp:
+        gc.collect()
+        if trace:
+            tracemalloc.start(FRAMES)
+        try:
+            app = MemoryApp(profile)
+            # Never index synthetic tasks into the user's own search cache
+            db_path = os.path.join(tmp, "search.db")
+            app.search_index = SearchIndex(db_path)
+            with frame_pacing(app.profile.max_fps):
+                async with app.run_test(size=size) as pilot:
+                    await app.workers.wait_for_complete()
+                    await pilot.pause()
+                    await pilot.press("slash")
+                    await app.workers.wait_for_complete()
+                    await pilot.press(*"task")
+                    await pilot.pause()
+                    searching = take_snapshot()
+                    await pilot.press("escape")
+                    await pilot.pause()
+                    steady = take_snapshot()
+                    peak = tracemalloc.get_traced_memory()[1]
+            if app.search_index.reader is not None:
+                app.search_index.reader.close()
+        finally:
+            tracemalloc.stop()
+        search_db = disk_size(db_path)
+    if not trace:
+        return None
+    # Only analysed now, tracing our own bookkeeping would slow it down tenfold
+    return {
+        "tasks": tasks,
+        "peak": peak,
+        "steady": sum(trace.size for trace in steady.traces),
+        "search db": search_db,
+        "subsystems": Attribution().breakdown(searching),
+    }
+
+
+def build_report(loaded, smaller):
+    """The loaded run plus its growth over a smaller one, scaled to 10k tasks."""
+    scale = 10000 / max(loaded["tasks"] - smaller["tasks"], 1)
+
+    def growth(new, old):
+        return round((new - old) * scale)
+
+    per_10k = {
+        "peak": growth(loaded["peak"], smaller["peak"]),
+        "steady": growth(loaded["steady"], smaller["steady"]),
+        "search db": growth(loaded["search db"], smaller["search db"]),
+    }
+    for name, size in loaded["subsystems"].items():
+        per_10k[name] = growth(size, smaller["subsystems"][name])
+    return dict(loaded, per_10k=per_10k)
+
+
+def check(report, budgets=BUDGETS_PER_10K):
+    """Where the per-10k growth is over its budget or invalid; empty if nowhere."""
+    problems = []
+    for name, limit in budgets.items():
+        growth = report["per_10k"].get(name, 0)
+        if name in MUST_GROW and growth < 0:
+            problems.append(
+                f"{name}: shrank by {-growth / MB:.1f} MB per 10k tasks, "
+                "the runs are too close in size to compare"
+            )
+        elif growth > limit:
+            problems.append(
+                f"{name}: {growth / MB:.1f} MB per 10k tasks "
+                f"(budget {limit / MB:.1f} MB)"
+            )
+    return problems
+
+
+def format_report(report):
+    per_10k = report["per_10k"]
+    lines = [
+        f"{report['tasks']} pending tasks | peak {report['peak'] / MB:.1f} MB  "
+        f"steady {report['steady'] / MB:.1f} MB | per 10k tasks: "
+        f"peak +{per_10k['peak'] / MB:.1f} MB  steady +{per_10k['steady'] / MB:.1f} MB"
+    ]
+    lines.append(
+        f"  {'search db':<14}{report['search db'] / MB:>8.1f} MB  "
+        f"{per_10k['search db'] / MB:>+8.1f} MB per 10k (on disk)"
+    )
+    for name, size in report["subsystems"].items():
+        lines.append(
+            f"  {name:<14}{size / MB:>8.1f} MB  {per_10k[name] / MB:>+8.1f} MB per 10k"
+        )
+    return "\n".join(lines)
+
+
+def format_breakdown(sizes):
+    """One line of live MB per subsystem, for the app's debug panel."""
+    return "  ".join(f"{name} {size / MB:.1f} MB" for name, size in sizes.items())
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="task_tui.memcheck", description=__doc__)
+    parser.add_argument(
+        "--tasks", type=int, default=2000, help="synthetic pending tasks"
+    )
+    parser.add_argument(
+        "--profile", choices=sorted(PROFILES), default="full", help="render profile"
+    )
+    parser.add_argument("--save", help="write the report as JSON")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit 1 if growth per 10k tasks is over BUDGETS_PER_10K",
+    )
+    args = parser.parse_args()
+
+    profile = PROFILES[args.profile]
+    # Import and fill whatever the app loads on first use, so neither run is
+    # charged for it
+    asyncio.run(measure(args.tasks // 4, profile, trace=False))
+    smaller = asyncio.run(measure(args.tasks // 4, profile))
+    report = build_report(asyncio.run(measure(args.tasks, profile)), smaller)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+    print(format_report(report))
+    if args.check:
+        over = check(report)
+        for line in over:
+            print(f"❌ {line}")
+        if over:
+            sys.exit(1)
+        print("✅ Memory within budget")
+
+
+if __name__ == "__main__":
+    main()
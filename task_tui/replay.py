@@ -0,0 +1,397 @@
+"""Replay key sequences against TaskProApp and report keystroke-to-paint latency
+and the bytes written to the terminal per key."""
+
+import argparse
+import asyncio
+import gc
+import json
+import random
+import subprocess
+import sys
+import time
+import uuid as uuid_lib
+from datetime import datetime, timedelta, timezone
+
+from textual import events
+
+from task_tui.app import (
+    PROFILES,
+    TaskProApp,
+    frame_pacing,
+    parse_tw_date,
+    set_backend,
+    tw_date,
+)
+
+# Upper bounds of the histogram buckets, in milliseconds
+BUCKETS_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+# Used when no script is given: navigation, selection, search, a done + undo,
+# quick date, the summary sidebar, the dependency list and the history modal
+DEFAULT_SCRIPT = {
+    "size": [160, 50],
+    "keys": ["j"] * 20
+    + ["k"] * 5
+    + ["G", "g", "space", "j", "space", "j", "space"]
+    + ["slash", "t", "a", "s", "k", "escape"]
+    + ["d", "u", "t", "n", "o", "j", "o", "v", "escape", "H", "j", "escape"],
+}
+
+
+# --- SYNTHETIC TASKWARRIOR ---
+class SyntheticBackend:
+    """An in-memory stand-in for `task`, so a replay measures the UI only.
+
+    It understands the commands the app sends: exports filtered by uuid, id,
+    status and end/modified dates, modify/done/delete/start/stop, add,
+    import, count and the few helper reports.
+    """
+
+    PROJECTS = ["work", "work.api", "work.ui", "home", "home.garden", "errands"]
+    TAGS = ["next", "waiting", "bug", "call", "someday", "review"]
+    CONFIG = "weekstart=monday\nurgency.user.tag.next.coefficient=15.0\n"
+
+    def __init__(self, pending=500, completed=250, seed=0):
+        rng = random.Random(seed)
+        now = datetime.now(timezone.utc)
+        self.tasks = {}
+        self.next_id = 1
+        for n in range(pending + completed):
+            t = {
+                "uuid": str(uuid_lib.UUID(int=rng.getrandbits(128), version=4)),
+                "description": f"synthetic task {n} {rng.choice(self.TAGS)}",
+                "entry": tw_date(now - timedelta(days=rng.randint(1, 400))),
+                "modified": tw_date(now - timedelta(hours=rng.randint(1, 500))),
+                "status": "pending",
+                "urgency": round(rng.uniform(0, 20), 4),
+            }
+            if rng.random() < 0.8:
+                t["project"] = rng.choice(self.PROJECTS)
+            if rng.random() < 0.5:
+                t["tags"] = rng.sample(self.TAGS, rng.randint(1, 2))
+            if rng.random() < 0.4:
+                t["priority"] = rng.choice("HML")
+            if rng.random() < 0.4:
+                t["due"] = tw_date(now + timedelta(hours=rng.randint(-200, 900)))
+            if n >= pending:
+                t["status"] = "completed"
+                t["end"] = tw_date(now - timedelta(hours=rng.randint(1, 2000)))
+            else:
+                t["id"] = self.next_id
+                self.next_id += 1
+                # Only depend on earlier tasks so the graph has no cycles
+                if n > 10 and rng.random() < 0.1:
+                    earlier = list(self.tasks.values())[rng.randint(0, n - 1)]
+                    if earlier["status"] == "pending":
+                        t["depends"] = [earlier["uuid"]]
+            self.tasks[t["uuid"]] = t
+
+    def matches(self, t, filters):
+        refs = [f for f in filters if len(f) == 36 or f.isdigit()]
+        if refs and t["uuid"] not in refs and str(t.get("id")) not in refs:
+            return False
+        statuses = [f[7:] for f in filters if f.startswith("status:")]
+        if statuses and t["status"] not in statuses:
+            return False
+        for f in filters:
+            attr, _, value = f.partition(":")
+            if attr.endswith((".after", ".before")):
+                field, _, op = attr.partition(".")
+                stamp = parse_tw_date(t.get(field))
+                bound = parse_tw_date(value)
+                if not stamp or not bound:
+                    return False
+                if (op == "after" and stamp <= bound) or (
+                    op == "before" and stamp >= bound
+                ):
+                    return False
+        return True
+
+    def modify(self, t, words):
+        for word in words:
+            attr, _, value = word.partition(":")
+            if attr in ("tags", "depends"):
+                value = [v for v in value.split(",") if v]
+            if value in ("", []):
+                t.pop(attr, None)
+            else:
+                t[attr] = value
+        if t["status"] == "pending" and not t.get("id"):
+            t["id"] = self.next_id
+            self.next_id += 1
+        elif t["status"] != "pending":
+            t.pop("id", None)
+
+    def run(self, cmd, input=None):
+        words = [w for w in cmd[1:] if not w.startswith("rc.")]
+        now = tw_date(datetime.now(timezone.utc))
+        out = ""
+        if "export" in words:
+            filters = [w for w in words if w != "export"]
+            out = json.dumps(
+                [t for t in self.tasks.values() if self.matches(t, filters)]
+            )
+        elif words[-1:] == ["count"]:
+            filters = words[:-1]
+            out = f"{sum(self.matches(t, filters) for t in self.tasks.values())}\n"
+        elif words[:1] == ["_show"]:
+            out = self.CONFIG
+        elif words[:1] == ["+LATEST"]:
+            out = max(self.tasks.values(), key=lambda t: t["entry"])["uuid"]
+        elif words[:1] == ["add"]:
+            t = {"uuid": str(uuid_lib.uuid4()), "status": "pending", "entry": now}
+            self.modify(t, words[1:])
+            t["modified"] = now
+            self.tasks[t["uuid"]] = t
+        elif words[:1] == ["import"]:
+            for t in json.loads(input or "[]"):
+                self.modify(t, [])
+                self.tasks[t["uuid"]] = t
+        elif words[:1] not in (["sync"], ["undo"]):
+            verbs = ("modify", "done", "delete", "start", "stop")
+            i = next((i for i, w in enumerate(words) if w in verbs), None)
+            if i is None:
+                return subprocess.CompletedProcess(cmd, 1, "", f"unsupported {words}")
+            targets = [t for t in self.tasks.values() if self.matches(t, words[:i])]
+            verb = words[i]
+            for t in targets:
+                if verb == "modify":
+                    self.modify(t, words[i + 1 :])
+                elif verb in ("done", "delete"):
+                    status = "completed" if verb == "done" else "deleted"
+                    self.modify(t, [f"status:{status}", f"end:{now}"])
+                else:
+                    self.modify(t, [f"start:{now if verb == 'start' else ''}"])
+                t["modified"] = now
+        return subprocess.CompletedProcess(cmd, 0, out, "")
+
+
+# --- RECORDING ---
+class RecordingApp(TaskProApp):
+    """TaskProApp that remembers every key it receives."""
+
+    def __init__(self, profile=None):
+        super().__init__(profile)
+        self.keys = []
+
+    async def on_event(self, event) -> None:
+        if isinstance(event, events.Key) and not event.is_forwarded:
+            self.keys.append(event.key)
+        await super().on_event(event)
+
+
+def record(path, profile=None):
+    """Run the app normally and save the keys of the session as a script."""
+    app = RecordingApp(profile)
+    with frame_pacing(app.profile.max_fps):
+        app.run()
+    keys = app.keys
+    # The key that quit the app would end the replay early
+    if keys and keys[-1] == "q":
+        keys = keys[:-1]
+    with open(path, "w") as f:
+        json.dump({"size": list(app.size), "keys": keys}, f, indent=2)
+    print(f"Recorded {len(keys)} keys to {path}")
+
+
+# --- REPLAY ---
+class ReplayApp(TaskProApp):
+    """TaskProApp that timestamps and sizes every frame it hands to the driver."""
+
+    def __init__(self, profile=None):
+        super().__init__(profile)
+        self.frames = []  # (perf_counter, bytes a terminal would receive)
+
+    def _display(self, screen, renderable) -> None:
+        if renderable is not None:
+            stamp = time.perf_counter()
+            # Headless drivers write nothing, render what a terminal would get
+            if hasattr(renderable, "render_segments"):
+                output = renderable.render_segments(self.console)
+            else:
+                output = self.console._render_buffer(self.console.render(renderable))
+            self.frames.append((stamp, len(output.encode())))
+        super()._display(screen, renderable)
+
+    def on_unmount(self, event) -> None:
+        # No screen clearing or `task sync` at the end of a replay
+        event.prevent_default()
+
+
+async def replay(script, profile=None, timeout=2.0):
+    """Press each key; returns [(key, ms to the next frame or None, bytes)]."""
+    app = ReplayApp(profile)
+    samples = []
+    screen_size = tuple(script.get("size", (160, 50)))
+    with frame_pacing(app.profile.max_fps):
+        async with app.run_test(size=screen_size) as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            for key in script["keys"]:
+                if not app.is_running:
+                    break
+                frames = len(app.frames)
+                start = time.perf_counter()
+                await pilot.press(key)
+                while (
+                    len(app.frames) == frames and time.perf_counter() - start < timeout
+                ):
+                    await asyncio.sleep(0.0005)
+                painted = None
+                if len(app.frames) > frames:
+                    painted = (app.frames[frames][0] - start) * 1000
+                # Let background work finish so one key's tail is not the next key's cost
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                written = sum(size for _, size in app.frames[frames:])
+                samples.append((key, painted, written))
+                gc.collect()
+    return samples
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    if not values:
+        return None
+    return round(values[min(len(values) - 1, int(len(values) * pct / 100))], 2)
+
+
+def build_report(samples):
+    """Histogram and percentiles of the samples, overall and per key."""
+    painted = [ms for _, ms, _ in samples if ms is not None]
+    written = [size for _, _, size in samples]
+    histogram = {f"<={b}ms": 0 for b in BUCKETS_MS}
+    histogram[f">{BUCKETS_MS[-1]}ms"] = 0
+    for ms in painted:
+        bucket = next((b for b in BUCKETS_MS if ms <= b), None)
+        histogram[f"<={bucket}ms" if bucket else f">{BUCKETS_MS[-1]}ms"] += 1
+    by_key = {}
+    bytes_by_key = {}
+    for key, ms, size in samples:
+        bytes_by_key.setdefault(key, []).append(size)
+        if ms is not None:
+            by_key.setdefault(key, []).append(ms)
+    return {
+        "keys": len(samples),
+        "unpainted": len(samples) - len(painted),
+        "p50": percentile(painted, 50),
+        "p90": percentile(painted, 90),
+        "p99": percentile(painted, 99),
+        "max": round(max(painted), 2) if painted else None,
+        "histogram": histogram,
+        "bytes_total": sum(written),
+        "bytes_p50": percentile(written, 50),
+        "by_key": {
+            key: {
+                "count": len(sizes),
+                "p50": percentile(by_key.get(key, []), 50),
+                "p90": percentile(by_key.get(key, []), 90),
+                "bytes_p50": percentile(sizes, 50),
+            }
+            for key, sizes in sorted(bytes_by_key.items())
+        },
+    }
+
+
+def format_report(report):
+    lines = [
+        f"{report['keys']} keys, {report['unpainted']} without a repaint | "
+        f"p50 {report['p50']}ms  p90 {report['p90']}ms  p99 {report['p99']}ms  "
+        f"max {report['max']}ms | {report['bytes_total']} bytes written, "
+        f"p50 {report['bytes_p50']} per key"
+    ]
+    top = max(report["histogram"].values()) or 1
+    for bucket, count in report["histogram"].items():
+        lines.append(f"{bucket:>9} {'█' * round(40 * count / top):<40} {count}")
+    for key, stats in report["by_key"].items():
+        lines.append(
+            f"{key:>12}: n={stats['count']:<4} p50 {stats['p50']}ms  "
+            f"p90 {stats['p90']}ms  {stats['bytes_p50']} bytes"
+        )
+    return "\n".join(lines)
+
+
+def compare(report, baseline, tolerance=0.5, slack_ms=5.0, min_count=5):
+    """Where report is slower than baseline beyond tolerance; empty if nowhere.
+
+    Single keys are compared on their median, and only with min_count
+    samples on both sides: a handful of presses is too noisy to judge.
+    """
+
+    def worse(name, new, old, slack=slack_ms, unit="ms"):
+        if new is None or old is None:
+            return []
+        limit = old * (1 + tolerance) + slack
+        if new > limit:
+            return [
+                f"{name}: {new}{unit} (baseline {old}{unit}, limit {limit:.2f}{unit})"
+            ]
+        return []
+
+    regressions = []
+    for name in ("p50", "p90"):
+        regressions += worse(name, report[name], baseline.get(name))
+    # Output size hardly varies between runs, a small slack is enough
+    regressions += worse(
+        "bytes p50", report["bytes_p50"], baseline.get("bytes_p50"), 64, " bytes"
+    )
+    for key, stats in report["by_key"].items():
+        old = baseline.get("by_key", {}).get(key)
+        if old and min(stats["count"], old["count"]) >= min_count:
+            regressions += worse(f"{key} p50", stats["p50"], old["p50"])
+            regressions += worse(
+                f"{key} bytes", stats["bytes_p50"], old.get("bytes_p50"), 64, " bytes"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="task_tui.replay", description=__doc__)
+    parser.add_argument(
+        "script", nargs="?", help="JSON script ({'size': [w, h], 'keys': [...]})"
+    )
+    parser.add_argument(
+        "--tasks", type=int, default=500, help="synthetic pending tasks"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="replays to sample")
+    parser.add_argument(
+        "--profile", choices=sorted(PROFILES), default="full", help="render profile"
+    )
+    parser.add_argument("--save", help="write the report as JSON (diffable)")
+    parser.add_argument("--baseline", help="fail if slower than this saved report")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="allowed slowdown over the baseline (0.5 = 50%%)",
+    )
+    args = parser.parse_args()
+
+    script = DEFAULT_SCRIPT
+    if args.script:
+        with open(args.script) as f:
+            script = json.load(f)
+
+    samples = []
+    for n in range(args.repeat):
+        # The same seed every time, so each replay sees identical data
+        set_backend(SyntheticBackend(pending=args.tasks, completed=args.tasks // 2))
+        samples += asyncio.run(replay(script, PROFILES[args.profile]))
+    report = build_report(samples)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+    print(format_report(report))
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"❌ {line}")
+        if regressions:
+            sys.exit(1)
+        print("✅ No latency regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
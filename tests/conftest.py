@@ -0,0 +1,45 @@
+"""Fixtures shared by the tests: local time zone, task backend and headless app."""
+
+import time
+
+import pytest
+
+from task_tui import app as task_app
+from task_tui.app import TaskProApp, load_task_config, set_backend
+
+
+class HeadlessApp(TaskProApp):
+    """TaskProApp that neither clears the terminal nor runs `task sync` on exit."""
+
+    def on_unmount(self, event) -> None:
+        event.prevent_default()
+
+
+@pytest.fixture
+def headless_app():
+    return HeadlessApp
+
+
+@pytest.fixture
+def paris(monkeypatch):
+    """Local time in Europe/Paris, where DST ends on 2026-10-25."""
+    monkeypatch.setenv("TZ", "Europe/Paris")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def use_backend():
+    """Swap the task backend for one test; the previous one is restored after."""
+    previous = task_app.backend
+
+    def use(backend):
+        set_backend(backend)
+        load_task_config.cache_clear()  # the rc of the old backend is cached
+        return backend
+
+    yield use
+    set_backend(previous)
+    load_task_config.cache_clear()
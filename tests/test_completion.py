@@ -0,0 +1,28 @@
+from task_tui.app import CompletionIndex, PrefixTrie, SortedPrefixIndex
+
+TASKS = [
+    {"uuid": "a", "id": 1, "description": "Buy milk"},
+    {"uuid": "b", "id": 12, "description": "Buy milk and eggs"},
+    {"uuid": "c", "id": 2, "description": "call 1st plumber"},
+]
+
+
+def test_sorted_index_completes_like_the_trie():
+    trie, index = PrefixTrie(), SortedPrefixIndex()
+    for t in TASKS:
+        for word in (str(t["id"]), t["description"]):
+            trie.add(word, t["uuid"])
+            index.add(word, t["uuid"])
+    for prefix in ("buy", "BUY MILK A", "1", "c", "x", ""):
+        assert index.complete(prefix) == trie.complete(prefix)
+
+
+def test_task_completion_follows_store_changes():
+    completion = CompletionIndex()
+    completion.apply([(None, t) for t in TASKS])
+    assert completion.tasks.complete("buy") == ["a", "b"]
+    renamed = dict(TASKS[0], description="Sell milk")
+    completion.apply([(TASKS[0], renamed), (TASKS[1], None)])
+    assert completion.tasks.complete("buy") == []
+    assert completion.tasks.complete("sel") == ["a"]
+    assert completion.tasks.complete("1") == ["a"]
@@ -0,0 +1,68 @@
+import asyncio
+import os
+import socket
+
+from task_tui.daemon import DaemonBackend, TaskDaemon, command_word
+from task_tui.replay import SyntheticBackend
+
+
+def test_run_only_accepts_task_commands(tmp_path):
+    daemon = TaskDaemon(path=str(tmp_path / "daemon.sock"))
+    for cmd in (["sh", "-c", "true"], [], ["/usr/bin/task", "export"]):
+        resp = asyncio.run(daemon.dispatch({"op": "run", "args": cmd}))
+        assert "error" in resp
+
+
+def test_connect_ignores_a_socket_owned_by_someone_else(tmp_path, monkeypatch):
+    path = str(tmp_path / "daemon.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        server.listen()
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+        assert DaemonBackend.connect(path) is None
+
+
+def test_command_word_skips_filters_and_arguments():
+    assert command_word(["task", "add", "count", "the", "show"]) == "add"
+    assert command_word(["task", "rc.bulk=0", "project:home", "count"]) == "count"
+    assert command_word(["task", "abc", "modify", "description:export"]) == "modify"
+
+
+def started(daemon):
+    """Run the daemon's first reload, without a socket."""
+
+    async def start():
+        daemon.changed = asyncio.Condition()
+        daemon.reload_lock = asyncio.Lock()
+        await daemon.refresh()
+
+    return start
+
+
+def test_mutation_with_a_read_only_word_reloads_the_store(tmp_path, use_backend):
+    backend = use_backend(SyntheticBackend(pending=3, completed=0))
+    daemon = TaskDaemon(str(tmp_path / "d.sock"), search_path=str(tmp_path / "s.db"))
+    daemon.direct = backend
+
+    async def session():
+        await started(daemon)()
+        await daemon.dispatch({"op": "run", "args": ["task", "add", "count", "stock"]})
+        return await daemon.dispatch({"op": "counts"})
+
+    assert asyncio.run(session())["pending"] == 4
+
+
+def test_search_is_served_from_the_index(tmp_path, use_backend):
+    backend = use_backend(SyntheticBackend(pending=3, completed=2))
+    done = next(t for t in backend.tasks.values() if t["status"] == "completed")
+    done["description"] = "renew passport"
+    daemon = TaskDaemon(str(tmp_path / "d.sock"), search_path=str(tmp_path / "s.db"))
+    daemon.direct = backend
+
+    async def session():
+        await started(daemon)()
+        return await daemon.dispatch({"op": "search", "query": "pass"})
+
+    [found] = asyncio.run(session())["tasks"]
+    assert (found["uuid"], found["status"]) == (done["uuid"], "completed")
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+import pytest
+
+from task_tui.app import eval_date, format_due_input, tw_date
+
+NOW = datetime(2026, 10, 19, 12, 0)  # still in summer time
+
+
+@pytest.mark.parametrize(
+    "expr, stamp",
+    [
+        ("2026-11-02", "20261101T230000Z"),
+        ("nov", "20261031T230000Z"),
+        ("monday+1wk", "20261101T230000Z"),
+        ("tomorrow+14d", "20261102T230000Z"),
+        ("today", "20261018T220000Z"),
+        ("20261019T100000Z", "20261019T100000Z"),
+        ("2026-10-19T10:00:00Z", "20261019T100000Z"),
+    ],
+)
+def test_dates_past_dst_change_keep_local_midnight(paris, expr, stamp):
+    assert tw_date(eval_date(expr, now=NOW, weekstart="monday")) == stamp
+
+
+def test_due_input_round_trips_across_dst(paris):
+    for stamp in ("20261101T230000Z", "20261018T220000Z", "20261105T143000Z"):
+        assert tw_date(eval_date(format_due_input(stamp), now=NOW)) == stamp
+
+
+@pytest.mark.parametrize(
+    "expr, now, day",
+    [
+        ("som", datetime(2026, 10, 19, 12, 0), datetime(2026, 11, 1)),
+        ("socm", datetime(2026, 10, 19, 12, 0), datetime(2026, 10, 1)),
+        ("sow", datetime(2026, 10, 19, 12, 0), datetime(2026, 10, 25)),
+        ("soww", datetime(2026, 2, 1, 12, 0), datetime(2026, 2, 2)),
+        ("soww", datetime(2026, 2, 2, 12, 0), datetime(2026, 2, 9)),
+        ("socww", datetime(2026, 2, 1, 12, 0), datetime(2026, 1, 26)),
+        ("soq", datetime(2026, 10, 19, 12, 0), datetime(2027, 1, 1)),
+        ("soy", datetime(2026, 10, 19, 12, 0), datetime(2027, 1, 1)),
+        ("eom", datetime(2026, 10, 19, 12, 0), datetime(2026, 10, 31, 23, 59, 59)),
+    ],
+)
+def test_bare_period_starts_are_the_next_period(expr, now, day):
+    assert eval_date(expr, now=now).replace(tzinfo=None) == day
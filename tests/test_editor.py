@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from task_tui.replay import SyntheticBackend
+
+
+def edit_description(app, backend, due):
+    """The editor's fields after loading a task due at `due` and renaming it."""
+    task = next(iter(backend.tasks.values()))
+    task["due"] = due
+
+    async def session():
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app.load_task_by_uuid(task["uuid"])
+            await pilot.pause()
+            app.query_one("#inp_desc").value = "renamed"
+            return app.editor_fields()
+
+    return asyncio.run(session())
+
+
+@pytest.mark.parametrize(
+    "due",
+    [
+        "20261101T230000Z",  # local midnight, after the switch back to CET
+        "20261019T221500Z",  # 00:15 local, on the day before in UTC
+        "20261025T013000Z",  # the second 02:30 of the night clocks go back
+    ],
+)
+def test_unchanged_due_is_kept(paris, use_backend, headless_app, due):
+    backend = use_backend(SyntheticBackend(pending=5, completed=0))
+    fields = edit_description(headless_app(), backend, due)
+    assert fields["description"] == "renamed"
+    assert fields["due"] == due
+
+
+class DayFirstBackend(SyntheticBackend):
+    """Reads due:DD/MM/YYYY the way Taskwarrior does with rc.dateformat=D/M/Y."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.modifies = []
+
+    def run(self, cmd, input=None):
+        if "modify" in cmd:
+            self.modifies.append(cmd)
+            for i, word in enumerate(cmd):
+                if word.startswith("due:") and "/" in word:
+                    day, month, year = word[4:].split("/")
+                    cmd = [*cmd[:i], f"due:{year}{month}{day}T000000Z", *cmd[i + 1 :]]
+        return super().run(cmd, input)
+
+
+def test_unreadable_due_is_left_to_taskwarrior(use_backend, headless_app):
+    backend = use_backend(DayFirstBackend(pending=5, completed=0))
+    uuid = next(iter(backend.tasks))
+    patched = []
+
+    class SaveApp(headless_app):
+        def apply_local_edit(self, uuids, fields):
+            patched.append(fields)
+            super().apply_local_edit(uuids, fields)
+
+    async def session():
+        app = SaveApp()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app.load_task_by_uuid(uuid)
+            await pilot.pause()
+            app.query_one("#inp_desc").value = "renamed"
+            app.query_one("#inp_due").value = "31/12/2026"
+            app.action_save_task()
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            return app.store.get(uuid)
+
+    task = asyncio.run(session())
+    assert "due:31/12/2026" in backend.modifies[0]
+    # Only the fields the app could read are patched before the refresh
+    assert patched == [{"description": "renamed"}]
+    assert task["due"] == "20261231T000000Z"
@@ -0,0 +1,25 @@
+from task_tui import app
+from task_tui.app import export_uuids
+from task_tui.replay import SyntheticBackend
+
+
+class CountingBackend(SyntheticBackend):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.exports = []
+
+    def run(self, cmd, input=None):
+        if "export" in cmd:
+            self.exports.append(cmd)
+        return super().run(cmd, input)
+
+
+def test_export_uuids_keeps_command_lines_short(monkeypatch, use_backend):
+    monkeypatch.setattr(app, "EXPORT_CHUNK", 4)
+    backend = use_backend(CountingBackend(pending=10, completed=0))
+    uuids = list(backend.tasks)
+    tasks = export_uuids(uuids)
+    assert sorted(t["uuid"] for t in tasks) == sorted(uuids)
+    assert [len(cmd) - 3 for cmd in backend.exports] == [4, 4, 2]
+    assert export_uuids([]) == []
+    assert len(backend.exports) == 3
@@ -0,0 +1,75 @@
+import random
+
+from task_tui.app import DependencyGraph
+
+
+def scanned_blocked(graph):
+    return {u for u in graph.forward if u in graph.nodes and graph.is_blocked(u)}
+
+
+def test_blocked_count_follows_edits():
+    graph = DependencyGraph()
+    graph.set_task("b", ["a"])  # depends on a task that is not loaded
+    assert graph.blocked_count() == 0
+    graph.set_task("a", [])
+    assert graph.blocked == {"b"}
+    graph.set_task("c", ["a", "b"])
+    assert graph.blocked_count() == 2
+    graph.remove_task("a")
+    assert graph.blocked == {"c"}
+    graph.set_task("c", [])
+    assert graph.blocked_count() == 0
+
+
+def test_blocked_count_matches_a_full_scan():
+    rng = random.Random(0)
+    graph = DependencyGraph()
+    uuids = [f"t{n}" for n in range(40)]
+    for _ in range(500):
+        uuid = rng.choice(uuids)
+        if rng.random() < 0.2:
+            graph.remove_task(uuid)
+        else:
+            graph.set_task(uuid, rng.sample(uuids, rng.randint(0, 3)))
+        assert graph.blocked == scanned_blocked(graph)
+
+
+def chain_graph():
+    """release <- tests <- code <- design, and release <- docs (a branch)."""
+    graph = DependencyGraph()
+    graph.set_task("design", [])
+    graph.set_task("code", ["design"])
+    graph.set_task("tests", ["code"])
+    graph.set_task("docs", [])
+    graph.set_task("release", ["tests", "docs"])
+    return graph
+
+
+def test_self_dependency_is_a_cycle():
+    assert chain_graph().find_cycle("code", ["code"]) == ["code", "code"]
+
+
+def test_indirect_cycle_is_reported_as_a_path():
+    graph = chain_graph()
+    # design depending on release would close release -> tests -> code -> design
+    assert graph.find_cycle("design", ["docs", "release"]) == [
+        "design",
+        "release",
+        "tests",
+        "code",
+        "design",
+    ]
+    assert graph.find_cycle("docs", ["design"]) is None
+
+
+def test_critical_path_takes_the_longest_branch():
+    graph = chain_graph()
+    assert graph.critical_path("release") == ["release", "tests", "code", "design"]
+    assert graph.critical_path() == ["release", "tests", "code", "design"]
+    assert graph.critical_path("docs") == ["docs"]
+
+
+def test_finished_prerequisites_leave_the_critical_path():
+    graph = chain_graph()
+    graph.remove_task("design")
+    assert graph.critical_path("release") == ["release", "tests", "code"]
@@ -0,0 +1,40 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from task_tui.app import HistoryCache, tw_date
+from task_tui.replay import SyntheticBackend
+
+
+@pytest.fixture
+def old_task(use_backend):
+    """Recent history (the last ~83 days) plus one task finished 3 years ago."""
+    backend = use_backend(SyntheticBackend(pending=5, completed=20))
+    old = next(t for t in backend.tasks.values() if t["status"] == "completed")
+    old["end"] = tw_date(datetime.now(timezone.utc) - timedelta(days=3 * 365))
+    return old
+
+
+def test_has_older_looks_past_the_window(old_task):
+    history = HistoryCache()
+    assert history.has_older(6)  # ~7 months back, the old task is still older
+    assert not history.has_older(40)
+
+
+def test_history_pages_past_a_long_gap(old_task, headless_app):
+    async def session():
+        app = headless_app()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app.action_history()
+            for _ in range(100):
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                screen = app.screen
+                if screen.exhausted:
+                    break
+                screen.load_next_page()
+            return screen.seen
+
+    assert old_task["uuid"] in asyncio.run(session())
@@ -0,0 +1,89 @@
+import json
+import subprocess
+from datetime import datetime, timezone
+
+import pytest
+
+from task_tui.app import import_tasks, read_import_rows, validate_import_row
+from task_tui.replay import SyntheticBackend
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+class StrictBackend(SyntheticBackend):
+    """Rejects a whole `task import` when any task in it is marked bad."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.imports = 0
+
+    def run(self, cmd, input=None):
+        if "import" in cmd:
+            self.imports += 1
+            if any("BAD" in t["description"] for t in json.loads(input)):
+                return (
+                    super()
+                    .run(["task", "unsupported"])
+                    .__class__(cmd, 1, "", "Could not import: bad task")
+                )
+        return super().run(cmd, input)
+
+
+def test_valid_row_becomes_an_importable_task():
+    task = validate_import_row(
+        {"description": "  pay rent ", "tags": "home, bills", "due": "2026-11-01"},
+        now=NOW,
+    )
+    assert task["description"] == "pay rent"
+    assert task["status"] == "pending"
+    assert task["tags"] == ["home", "bills"]
+    assert task["due"].startswith("2026") and task["due"].endswith("Z")
+    assert task["entry"] == "20261019T120000Z"
+    assert len(task["uuid"]) == 36
+
+
+@pytest.mark.parametrize(
+    "row, error",
+    [
+        ({"description": " "}, "missing description"),
+        ({"description": "x", "status": "open"}, "unknown status"),
+        ({"description": "x", "priority": "U"}, "unknown priority"),
+        ({"description": "x", "tags": ["a b"]}, "tags cannot contain spaces"),
+        ({"description": "x", "due": "someday soon"}, "due:"),
+        ({"description": "x", "uuid": "not-a-uuid"}, "invalid uuid"),
+    ],
+)
+def test_invalid_rows_are_rejected(row, error):
+    with pytest.raises(ValueError, match=error):
+        validate_import_row(row, now=NOW)
+
+
+def test_csv_rows_split_tags_and_skip_empty_cells(tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text("description,project,tags,due\nbuy milk,,home errands,\n")
+    [(line, row)] = read_import_rows(str(path))
+    assert line == 2
+    assert row == {"description": "buy milk", "tags": "home errands"}
+    assert validate_import_row(row, now=NOW)["tags"] == ["home", "errands"]
+
+
+def test_jsonl_reports_bad_lines(tmp_path):
+    path = tmp_path / "tasks.json"
+    path.write_text('{"description": "ok"}\n\nnot json\n[1]\n')
+    rows = list(read_import_rows(str(path)))
+    assert rows[0] == (1, {"description": "ok"})
+    assert rows[1][0] == 3 and rows[1][1].startswith("invalid JSON")
+    assert rows[2] == (4, "expected a JSON object")
+
+
+def test_failing_chunk_pins_the_error_on_its_row(use_backend):
+    backend = use_backend(StrictBackend(pending=0, completed=0))
+    tasks = [
+        validate_import_row({"description": f"task {n}"}, now=NOW) for n in range(8)
+    ]
+    tasks[5]["description"] = "BAD task"
+    errors = import_tasks(tasks)
+    assert errors == {tasks[5]["uuid"]: "Could not import: bad task"}
+    # The other seven made it in, found by halving: 8 -> 4+4 -> 2+2 -> 1+1
+    assert {t["uuid"] for t in tasks} - set(backend.tasks) == {tasks[5]["uuid"]}
+    assert backend.imports == 7
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from task_tui import app as task_app
+from task_tui.app import load_task_config, set_backend
+from task_tui.memcheck import BUDGETS_PER_10K, MB, build_report, check, measure
+
+SMALLER, LOADED = 50, 1000
+
+
+@pytest.fixture(scope="module")
+def report():
+    previous = task_app.backend
+    try:
+        # Fill the import and first-use caches at the smaller size, untraced
+        asyncio.run(measure(SMALLER, trace=False))
+        smaller = asyncio.run(measure(SMALLER))
+        return build_report(asyncio.run(measure(LOADED)), smaller)
+    finally:
+        set_backend(previous)
+        load_task_config.cache_clear()
+
+
+@pytest.mark.slow
+def test_report_is_within_budget(report):
+    assert set(BUDGETS_PER_10K) <= set(report["per_10k"])
+    assert check(report) == []
+
+
+@pytest.mark.slow
+def test_search_db_is_measured_on_disk(report):
+    assert report["search db"] > 0
+    assert report["per_10k"]["search db"] > 0
+    assert check(report, {"search db": 0})
+
+
+def test_shrinking_is_a_failed_measurement():
+    report = {"per_10k": {"peak": -58 * MB, "steady": 1 * MB, "render cache": -MB}}
+    budgets = {"peak": 64 * MB, "steady": 64 * MB, "render cache": 8 * MB}
+    [problem] = check(report, budgets)
+    assert problem.startswith("peak: shrank by 58.0 MB")
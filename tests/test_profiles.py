@@ -0,0 +1,38 @@
+import asyncio
+
+from textual import screen as textual_screen
+
+from task_tui.app import PROFILES, frame_pacing
+from task_tui.replay import SyntheticBackend
+
+
+def test_low_profile_paces_frames_only_while_it_runs(use_backend, headless_app):
+    default = textual_screen.UPDATE_PERIOD
+    use_backend(SyntheticBackend(pending=5, completed=0))
+    app = headless_app(PROFILES["low"])
+    assert textual_screen.UPDATE_PERIOD == default
+
+    async def session():
+        with frame_pacing(app.profile.max_fps):
+            async with app.run_test() as pilot:
+                await pilot.pause()
+                return app.screen._update_timer._interval
+
+    assert asyncio.run(session()) == 1 / 10
+    assert textual_screen.UPDATE_PERIOD == default
+
+
+def test_resting_editor_timer_does_not_outlive_the_app(use_backend, headless_app):
+    use_backend(SyntheticBackend(pending=5, completed=0))
+    app = headless_app(PROFILES["low"])
+
+    async def session():
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.press("j")
+            return app.active_uuid
+
+    # The app exits before the cursor has rested for editor_delay
+    uuid = asyncio.run(session())
+    assert app.editor_timer._task is None  # stopped along with its screen
+    app.show_resting_task(uuid)
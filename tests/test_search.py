@@ -0,0 +1,36 @@
+from task_tui.app import FuzzySearchScreen, TaskStore
+
+TASKS = [
+    {"uuid": "a", "id": 1, "description": "water plants", "urgency": 2.0},
+    {"uuid": "b", "id": 2, "description": "write report", "urgency": 9.0},
+    {"uuid": "c", "id": 3, "description": "review report", "urgency": 5.0},
+]
+
+
+class CountingStore(TaskStore):
+    def __init__(self):
+        super().__init__()
+        self.scans = 0
+
+    def tasks(self):
+        self.scans += 1
+        return super().tasks()
+
+
+def test_pending_matches_are_ranked_once_per_screen():
+    store = CountingStore()
+    store.load([dict(t, status="pending") for t in TASKS])
+    screen = FuzzySearchScreen(store)
+    assert [row[0] for row in screen.matches("")] == ["b", "c", "a"]
+    for term in ("re", "rep", "repo"):
+        assert [row[0] for row in screen.matches(term)] == ["b", "c"]
+    assert store.scans == 1
+
+
+def test_tasks_gone_since_ranking_are_skipped():
+    store = TaskStore()
+    store.load([dict(t, status="pending") for t in TASKS])
+    screen = FuzzySearchScreen(store)
+    screen.matches("")
+    store.load([dict(t, status="pending") for t in TASKS[:2]])
+    assert [row[0] for row in screen.matches("re")] == ["b"]
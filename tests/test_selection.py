@@ -0,0 +1,41 @@
+import asyncio
+
+from task_tui.app import Workspace, task_export
+from task_tui.replay import SyntheticBackend
+
+TASKS = [
+    {"uuid": "a", "description": "one", "project": "work", "urgency": 1.0},
+    {"uuid": "b", "description": "two", "project": "home", "urgency": 2.0},
+]
+
+
+def test_workspace_drops_selected_tasks_that_leave_it():
+    ws = Workspace("work", "project:work")
+    ws.rebuild(TASKS)
+    ws.selected_uuids.update({"a", "b"})
+    ws.rebuild(TASKS)
+    assert ws.selected_uuids == {"a"}
+    ws.apply([(TASKS[0], None)])
+    assert ws.selected_uuids == set()
+
+
+def test_task_finished_elsewhere_is_not_acted_on(use_backend, headless_app):
+    backend = use_backend(SyntheticBackend(pending=5, completed=0))
+    done, kept = list(backend.tasks)[:2]
+
+    async def session():
+        app = headless_app()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            app.set_selection({done, kept})
+            # Another client completes one of the selected tasks
+            backend.tasks[done]["status"] = "completed"
+            app.reconcile(task_export("status:pending"))
+            await pilot.pause()
+            selected = set(app.selected_uuids)
+            app.workspace.selected_uuids.add(done)  # even if one slipped through
+            return selected, app.action_targets()
+
+    selected, targets = asyncio.run(session())
+    assert selected == {kept}
+    assert targets == [kept]
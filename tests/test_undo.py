@@ -0,0 +1,44 @@
+from task_tui.app import TASK_BULK, Operation, OperationLog
+
+
+def test_modify_reverts_and_replays_field_values():
+    op = Operation(
+        "edit",
+        "modify",
+        {"a": {"project": "home", "tags": []}, "b": {"project": "home", "tags": []}},
+        {"a": {"project": "work", "tags": ["next"]}},
+    )
+    # Tasks that had the same values are reverted in one command
+    assert op.undo_commands() == [
+        [*TASK_BULK, "a", "b", "modify", "project:home", "tags:"]
+    ]
+    assert op.redo_commands() == [
+        [*TASK_BULK, "a", "modify", "project:work", "tags:next"]
+    ]
+
+
+def test_done_reopens_and_completes_again():
+    op = Operation("done", "done", {"a": {}, "b": {}})
+    assert op.undo_commands() == [[*TASK_BULK, "a", "b", "modify", "status:pending"]]
+    assert op.redo_commands() == [[*TASK_BULK, "a", "b", "done"]]
+
+
+def test_add_is_undone_by_deleting():
+    op = Operation("add", "add", {"a": {}})
+    assert op.undo_commands() == [[*TASK_BULK, "a", "delete"]]
+    assert op.redo_commands() == [[*TASK_BULK, "a", "modify", "status:pending"]]
+
+
+def test_new_record_clears_redo():
+    log = OperationLog(limit=2)
+    first, second, third = (Operation(n, "add", {n: {}}) for n in "abc")
+    log.record(first)
+    log.record(second)
+    assert log.undo() is second
+    assert log.undone == [second]
+    log.record(third)
+    assert log.redo() is None
+    assert log.done == [first, third]
+    log.record(second)
+    assert log.done == [third, second]  # only the last `limit` are kept
+    assert log.undo() is second and log.undo() is third and log.undo() is None
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from task_tui.app import DependencyGraph, UrgencyModel, tw_date
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+def urgency(config=None, graph=None, **fields):
+    task = {"uuid": "a", "status": "pending", "entry": tw_date(NOW), **fields}
+    return round(UrgencyModel(config or {}).compute(task, graph, now=NOW), 4)
+
+
+def ago(days):
+    return tw_date(NOW - timedelta(days=days))
+
+
+def test_next_tag():
+    # next 15.0 plus 0.8 for having one tag
+    assert urgency(tags=["next"]) == 15.8
+
+
+@pytest.mark.parametrize(
+    "days_overdue, expected",
+    [(7, 12.0), (30, 12.0), (0, 8.8), (-14, 2.4), (-30, 2.4)],
+)
+def test_due_proximity(days_overdue, expected):
+    assert urgency(due=ago(days_overdue)) == expected
+
+
+@pytest.mark.parametrize("days, expected", [(0, 0.0), (182.5, 1.0), (365, 2.0)])
+def test_age(days, expected):
+    assert urgency(entry=ago(days)) == expected
+
+
+def test_age_is_capped_at_age_max():
+    assert urgency(entry=ago(1000)) == 2.0
+    assert urgency({"urgency.age.max": "10"}, entry=ago(5)) == 1.0
+
+
+def test_blocked_and_blocking():
+    graph = DependencyGraph()
+    graph.set_task("a", ["b"])
+    graph.set_task("b", ["c"])
+    graph.set_task("c", [])
+    assert urgency(graph=graph) == -5.0
+    task = {"uuid": "b", "status": "pending", "entry": tw_date(NOW)}
+    assert UrgencyModel({}).compute(task, graph, now=NOW) == 3.0  # -5 + 8
+
+
+@pytest.mark.parametrize("priority, expected", [("H", 6.0), ("M", 3.9), ("L", 1.8)])
+def test_priority_defaults(priority, expected):
+    assert urgency(priority=priority) == expected
+
+
+def test_priority_coefficients_come_from_the_rc():
+    config = {
+        "urgency.uda.priority.H.coefficient": "10",
+        "urgency.uda.priority.X.coefficient": "2.5",
+    }
+    assert urgency(config, priority="H") == 10.0
+    assert urgency(config, priority="X") == 2.5